@@ -0,0 +1,228 @@
+"""
+bloom.py
+Contains the BloomFilter ADT and FilteredSearch, which puts a BloomFilter in
+front of any of the search functions so most misses return right away
+"""
+import math
+
+from search import _binary_search
+
+MASK = (1 << 64) - 1  # Keeps hashes to 64 bits
+
+
+def _mix(value):
+    """
+    Scrambles the bits of a 64 bit integer (the splitmix64 finalizer),
+    so keys that are close together land far apart in the filter
+
+    Parameters
+    ----------
+    value : int
+        The integer to scramble
+
+    Returns
+    -------
+    (int): The scrambled 64 bit integer
+    """
+    value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & MASK
+    value = (value ^ (value >> 27)) * 0x94D049BB133111EB & MASK
+    return value ^ (value >> 31)
+
+
+class BloomFilter:
+    """
+    A set that can only answer "maybe" or "no". Keys are never stored,
+    only a few bits each, so it takes a small fraction of the data's memory.
+    A "no" is always right; a "maybe" is wrong about error_rate of the time.
+
+    Attributes:
+    -----------
+    size : int
+        The number of bits in the filter
+    hash_count : int
+        The number of bits set for each key
+    count : int
+        The number of keys added
+
+    Methods:
+    --------
+    add(key): Adds a key to the filter
+    update(keys): Adds many keys to the filter
+    memory(): The number of bytes used by the bits
+    """
+
+    def __init__(self, capacity, error_rate=0.01):
+        """
+        Constructor for BloomFilter
+
+        Parameters:
+        -----------
+        capacity : int
+            The number of keys the filter is sized for
+        error_rate : float
+            The chance that a key that was never added looks like it was
+        """
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        capacity = max(capacity, 1)
+        # The sizes that give error_rate with the fewest bits
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        """
+        Yields the bit positions for a key, using double hashing:
+        the i-th position is h1 + i * h2
+
+        Parameters:
+        -----------
+        key : Hashable
+            The key being hashed
+        """
+        first = _mix(hash(key) & MASK)
+        second = _mix(first) | 1  # Odd, so the positions don't repeat early
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, key):
+        """
+        Adds a key to the filter
+
+        Parameters:
+        -----------
+        key : Hashable
+            The key being added
+        """
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def update(self, keys):
+        """
+        Adds many keys to the filter
+
+        Parameters:
+        -----------
+        keys : Iterable
+            The keys being added
+        """
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key):
+        """
+        Returns False if key was never added, True if it might have been
+        """
+        for position in self._positions(key):
+            if not self._bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def memory(self):
+        """
+        Returns the number of bytes used by the bits
+        """
+        return len(self._bits)
+
+    def __repr__(self):
+        """
+        Return a string of self
+        """
+        return f"BloomFilter({self.count} keys, {self.size} bits, {self.hash_count} hashes)"
+
+
+class FilteredSearch:
+    """
+    Puts a BloomFilter in front of a search function for one sorted dataset.
+    Targets the filter rules out return False at once; the rest go to
+    the search function.
+
+    Attributes:
+    -----------
+    lyst : Sequence
+        The sorted data being searched
+    search : Function
+        The search behind the filter, called as search(lyst, target)
+    bloom : BloomFilter
+        The filter over the keys in lyst
+    lookups : int
+        The number of searches made
+    rejected : int
+        The number of searches the filter answered on its own
+    false_positives : int
+        The number of searches the filter passed that missed anyway
+
+    Methods:
+    --------
+    contains(target): Is target in the data?
+    report(): Return the filter's memory and hit statistics
+    """
+
+    def __init__(self, lyst, search=_binary_search, error_rate=0.01):
+        """
+        Constructor for FilteredSearch
+
+        Parameters:
+        -----------
+        lyst : Sequence
+            A sorted sequence supporting len() and indexing
+        search : Function
+            Any of the search functions, like _binary_search,
+            _jump_search or _interpolation_search
+        error_rate : float
+            The filter's false positive rate
+        """
+        self.lyst = lyst
+        self.search = search
+        self.bloom = BloomFilter(len(lyst), error_rate)
+        self.bloom.update(lyst)
+
+        self.lookups = 0
+        self.rejected = 0
+        self.false_positives = 0
+
+    def contains(self, target):
+        """
+        Checks if target is in the data
+
+        Parameters:
+        -----------
+        target : int
+            The value being searched for
+
+        Returns:
+        --------
+        (Boolean): Is target in the data?
+        """
+        self.lookups += 1
+        if target not in self.bloom:
+            self.rejected += 1
+            return False
+
+        found = self.search(self.lyst, target)
+        if not found:
+            self.false_positives += 1
+        return found
+
+    def report(self):
+        """
+        Returns the filter's memory and hit statistics
+
+        Returns:
+        --------
+        (dict): The filter's size and the counts of lookups, rejected
+            lookups and false positives
+        """
+        return {
+            "memory_bytes": self.bloom.memory(),
+            "bits": self.bloom.size,
+            "hash_count": self.bloom.hash_count,
+            "lookups": self.lookups,
+            "rejected": self.rejected,
+            "false_positives": self.false_positives,
+            "hits": self.lookups - self.rejected - self.false_positives,
+        }
@@ -0,0 +1,173 @@
+"""
+eytzinger.py
+Contains the EytzingerArray ADT, a sorted sequence stored in
+breadth-first (Eytzinger) order for cache-friendly binary searching,
+and a benchmark comparing it with binary_search()
+"""
+import array
+import random
+import time
+
+from search import make_data, _binary_search
+
+
+class EytzingerArray:
+    """
+    Stores a sorted sequence as an implicit binary search tree laid out
+    level by level: the root at index 1 and the children of index k at
+    2k and 2k + 1. The first levels of the tree share a few cache lines,
+    and the 16 possible nodes four levels below k are side by side at
+    16k to 16k + 15, so each step of a search reads memory that is close
+    to the last step, unlike a flat binary search which jumps across the
+    whole array.
+
+    Attributes:
+    -----------
+    tree : array | List
+        The keys in Eytzinger order. tree[0] is unused
+    ranks : array
+        ranks[k] is the index in the sorted sequence of tree[k]
+
+    Methods:
+    --------
+    lower_bound(target): The first sorted index whose value is not less than target
+    contains(target): Is target in the data?
+    """
+
+    def __init__(self, lyst):
+        """
+        Constructor for EytzingerArray
+
+        Parameters:
+        -----------
+        lyst : Sequence
+            A sorted sequence supporting len() and indexing
+        """
+        length = len(lyst)
+        tree = [None] * (length + 1)
+        self.ranks = array.array("q", bytes(8 * (length + 1)))
+
+        # Fill the tree with an in-order walk; the walk visits
+        # tree positions in the same order as the sorted keys
+        stack = []
+        k = 1
+        i = 0
+        while stack or k <= length:
+            if k <= length:
+                stack.append(k)
+                k *= 2
+            else:
+                k = stack.pop()
+                tree[k] = lyst[i]
+                self.ranks[k] = i
+                i += 1
+                k = k * 2 + 1
+
+        try:
+            # Integer keys are packed into a compact array
+            tree[0] = 0
+            self.tree = array.array("q", tree)
+        except (TypeError, OverflowError):
+            self.tree = tree
+
+    def lower_bound(self, target):
+        """
+        Finds the first sorted index whose value is not less than target
+
+        Parameters:
+        -----------
+        target : int
+            The value being searched for
+
+        Returns:
+        --------
+        (int): The insertion point for target in the sorted sequence
+        """
+        tree = self.tree
+        length = len(tree) - 1
+        k = 1
+
+        # Go left or right without branching on the comparison
+        while k <= length:
+            k = 2 * k + (tree[k] < target)
+
+        # The answer is where the walk last went left: strip the
+        # trailing right turns (1 bits) and that final left turn
+        k >>= ((~k) & (k + 1)).bit_length()
+
+        return self.ranks[k] if k else length
+
+    def contains(self, target):
+        """
+        Checks if target is in the data
+
+        Parameters:
+        -----------
+        target : int
+            The value being searched for
+
+        Returns:
+        --------
+        (Boolean): Is target in the data?
+        """
+        tree = self.tree
+        length = len(tree) - 1
+        k = 1
+        while k <= length:
+            k = 2 * k + (tree[k] < target)
+        k >>= ((~k) & (k + 1)).bit_length()
+
+        return k != 0 and tree[k] == target
+
+    def __len__(self):
+        """
+        Returns the number of keys in the data
+        """
+        return len(self.tree) - 1
+
+
+def benchmark(sizes=(10 ** 6, 10 ** 7, 10 ** 8), queries=100_000):
+    """
+    Times EytzingerArray.contains() against _binary_search() (the
+    search behind binary_search(), without its per-call print) on
+    the same random targets at each size.
+
+    Parameters
+    ----------
+    sizes : Iterable
+        The data sizes to time
+    queries : int
+        The number of searches timed at each size
+
+    Returns
+    -------
+    (dict): {size: (binary seconds, eytzinger seconds)}
+    """
+    results = {}
+    for size in sizes:
+        lyst = make_data(size)
+        layout = EytzingerArray(lyst)
+        targets = [random.randrange(-1, size + 1) for _ in range(queries)]
+
+        start = time.perf_counter()
+        for target in targets:
+            _binary_search(lyst, target)
+        binary_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for target in targets:
+            layout.contains(target)
+        eytzinger_time = time.perf_counter() - start
+
+        print(f"{size:>12,} keys: binary_search {binary_time:.3f}s, "
+              f"eytzinger {eytzinger_time:.3f}s for {queries:,} searches")
+        results[size] = (binary_time, eytzinger_time)
+
+        # Free this size's data before building the next one
+        del lyst, layout
+
+    return results
+
+
+if __name__ == "__main__":
+    benchmark()
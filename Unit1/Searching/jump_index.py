@@ -0,0 +1,180 @@
+"""
+jump_index.py
+Contains the JumpIndex ADT, a reusable index for jump searching a sorted list
+"""
+import array
+import math
+
+from search import lower_bound
+
+# The number of 8 byte keys that fit in one 64 byte cache line.
+# Blocks are never made smaller than this.
+CACHE_LINE_KEYS = 8
+
+
+class JumpIndex:
+    """
+    Stores every step-th key of a sorted sequence (the fence keys) in a
+    compact array. A lookup searches the small fence array to find the
+    block holding target, then searches only that block of the data.
+
+    Attributes:
+    -----------
+    lyst : Sequence
+        The sorted data being indexed
+    step : int
+        The number of keys between two fence keys
+    fences : array | List
+        The fence keys. fences[i] == lyst[i * step]
+
+    Methods:
+    --------
+    lower_bound(target): The first index whose value is not less than target
+    contains(target): Is target in the data?
+    extend(values): Appends sorted values to the data and indexes them
+    rebuild(step): Rebuilds the fence keys from scratch
+    """
+
+    def __init__(self, lyst, step=None):
+        """
+        Constructor for JumpIndex
+
+        Parameters:
+        -----------
+        lyst : Sequence
+            A sorted sequence supporting len() and indexing
+        step : int
+            The number of keys between fence keys. Defaults to sqrt(n),
+            but never less than a cache line of keys
+        """
+        self.lyst = lyst
+        self.step = None
+        self.fences = None
+        self._fixed_step = step is not None
+        self.rebuild(step)
+
+    @staticmethod
+    def _default_step(length):
+        """
+        Returns the default step for a sequence of the given length
+        """
+        return max(CACHE_LINE_KEYS, math.isqrt(length))
+
+    def rebuild(self, step=None):
+        """
+        Rebuilds the fence keys from scratch
+
+        Parameters:
+        -----------
+        step : int
+            The new step. Defaults to the current fixed step or sqrt(n)
+        """
+        if step is not None:
+            self._fixed_step = True
+        elif self._fixed_step:
+            step = self.step
+        else:
+            step = self._default_step(len(self.lyst))
+
+        if step < 1:
+            raise ValueError("step must be at least 1")
+
+        self.step = step
+        fences = [self.lyst[i] for i in range(0, len(self.lyst), step)]
+        try:
+            # Integer keys are packed into a compact array
+            self.fences = array.array("q", fences)
+        except (TypeError, OverflowError):
+            self.fences = fences
+
+    def extend(self, values):
+        """
+        Appends sorted values to the end of the data and indexes them.
+        Only the new fence keys are added, unless the data has grown
+        enough that the default step should change.
+
+        Parameters:
+        -----------
+        values : Iterable
+            Values, smallest to largest, that are not less than the
+            last value in the data
+
+        Raises:
+        -------
+        ValueError: If the values would leave the data unsorted
+        """
+        values = list(values)
+        if not values:
+            return
+
+        last = self.lyst[-1] if len(self.lyst) else None
+        for value in values:
+            if last is not None and value < last:
+                raise ValueError("values must keep the data sorted")
+            last = value
+
+        self.lyst.extend(values)
+
+        # Rebuild once the data has grown past twice the size the step fits
+        if not self._fixed_step and self._default_step(len(self.lyst)) > self.step * 2:
+            self.rebuild()
+            return
+
+        # The existing fences already cover every index before this one
+        first_new_fence = len(self.fences) * self.step
+        try:
+            for i in range(first_new_fence, len(self.lyst), self.step):
+                self.fences.append(self.lyst[i])
+        except (TypeError, OverflowError):
+            # A new key doesn't fit in the compact array
+            self.rebuild()
+
+    def lower_bound(self, target):
+        """
+        Finds the first index whose value is not less than target
+
+        Parameters:
+        -----------
+        target : int
+            The value being searched for
+
+        Returns:
+        --------
+        (int): The insertion point for target
+        """
+        # The first fence key not less than target
+        fence = lower_bound(self.fences, target)
+
+        # Every key before the previous fence's block is less than target,
+        # and the key at this fence is not, so the answer is in between
+        low = (fence - 1) * self.step + 1 if fence > 0 else 0
+        high = min(fence * self.step, len(self.lyst))
+        return lower_bound(self.lyst, target, low, high)
+
+    def contains(self, target):
+        """
+        Checks if target is in the data
+
+        Parameters:
+        -----------
+        target : int
+            The value being searched for
+
+        Returns:
+        --------
+        (Boolean): Is target in the data?
+        """
+        index = self.lower_bound(target)
+        return index < len(self.lyst) and self.lyst[index] == target
+
+    def __len__(self):
+        """
+        Returns the number of keys in the data
+        """
+        return len(self.lyst)
+
+    def __repr__(self):
+        """
+        Return a string of self
+        """
+        return f"JumpIndex({len(self.lyst)} keys, step={self.step}, {len(self.fences)} fences)"
@@ -0,0 +1,218 @@
+"""
+learned_index.py
+Contains the LearnedIndex ADT, a piecewise-linear model of where each key
+is in a sorted sequence of numbers
+"""
+import array
+import sys
+
+from search import lower_bound, upper_bound
+
+
+class LearnedIndex:
+    """
+    Learns a piecewise-linear function from key to position over a sorted
+    sequence of numbers. Each segment guesses a key's position to within
+    max_error places, so a lookup is one search of the segment keys and
+    one binary search of a window of about 2 * max_error keys.
+
+    The segments are fit with the shrinking cone method: a segment grows
+    while some line through its first point stays within error of every
+    point after it.
+
+    Attributes:
+    -----------
+    lyst : Sequence
+        The sorted data being indexed
+    error : int
+        The largest error allowed when fitting the model
+    max_error : int
+        The largest error the model actually makes on the data
+
+    Methods:
+    --------
+    lower_bound(target): The first index whose value is not less than target
+    contains(target): Is target in the data?
+    report(): Return the size and error of the model
+    """
+
+    def __init__(self, lyst, error=32):
+        """
+        Constructor for LearnedIndex
+
+        Parameters:
+        -----------
+        lyst : Sequence
+            A sorted sequence of numbers supporting len() and indexing
+        error : int
+            The largest error allowed when fitting the model
+        """
+        if error < 1:
+            raise ValueError("error must be at least 1")
+
+        self.lyst = lyst
+        self.error = error
+        self.max_error = 0
+
+        self._keys = []  # The first key of each segment
+        self._slopes = array.array("d")  # The slope of each segment
+        self._positions = array.array("d")  # The position of each segment's first key
+
+        self._fit()
+
+        try:
+            # Integer keys are packed into a compact array
+            self._keys = array.array("q", self._keys)
+        except (TypeError, OverflowError):
+            pass
+
+    def _fit(self):
+        """
+        Fits the segments of the model to the data
+        """
+        points = []  # The (key, position) points of the current segment
+        slope_low = 0.0
+        slope_high = float("inf")
+
+        previous = None
+        for position, key in enumerate(self.lyst):
+            # Only the first copy of a key matters to lower_bound
+            if key == previous:
+                continue
+            previous = key
+
+            if points:
+                first_key, first_position = points[0]
+                distance = key - first_key
+                low = max(slope_low, (position - self.error - first_position) / distance)
+                high = min(slope_high, (position + self.error - first_position) / distance)
+
+                if low <= high:
+                    slope_low, slope_high = low, high
+                    points.append((key, position))
+                    continue
+
+                # No line fits the new point; close the segment and start another
+                self._add_segment(points, slope_low, slope_high)
+
+            points = [(key, position)]
+            slope_low = 0.0
+            slope_high = float("inf")
+
+        if points:
+            self._add_segment(points, slope_low, slope_high)
+
+    def _add_segment(self, points, slope_low, slope_high):
+        """
+        Used in _fit().
+        Adds a segment through the first point, halfway between the
+        smallest and largest slopes that fit, and records its error.
+
+        Parameters:
+        -----------
+        points : List
+            The (key, position) points covered by the segment
+        slope_low : float
+            The smallest slope that fits every point
+        slope_high : float
+            The largest slope that fits every point
+        """
+        slope = 0.0 if slope_high == float("inf") else (slope_low + slope_high) / 2
+        first_key, first_position = points[0]
+
+        self._keys.append(first_key)
+        self._slopes.append(slope)
+        self._positions.append(first_position)
+
+        for key, position in points:
+            predicted = int(first_position + slope * (key - first_key))
+            self.max_error = max(self.max_error, abs(predicted - position))
+
+    def lower_bound(self, target):
+        """
+        Finds the first index whose value is not less than target
+
+        Parameters:
+        -----------
+        target : int
+            The value being searched for
+
+        Returns:
+        --------
+        (int): The insertion point for target
+        """
+        length = len(self.lyst)
+        if length == 0:
+            return 0
+
+        # The segment whose first key is the last one not greater than target
+        segment = max(upper_bound(self._keys, target) - 1, 0)
+
+        predicted = int(self._positions[segment]
+                        + self._slopes[segment] * (target - self._keys[segment]))
+
+        # The window the model says the answer is in
+        low = min(max(predicted - self.max_error - 1, 0), length)
+        high = min(max(predicted + self.max_error + 2, low), length)
+
+        # Keys between the segment's data keys can fall just outside the
+        # window; check the edges and widen the search if they do
+        if low > 0 and self.lyst[low - 1] >= target:
+            low = 0
+        if high < length and self.lyst[high] < target:
+            high = length
+
+        return lower_bound(self.lyst, target, low, high)
+
+    def contains(self, target):
+        """
+        Checks if target is in the data
+
+        Parameters:
+        -----------
+        target : int
+            The value being searched for
+
+        Returns:
+        --------
+        (Boolean): Is target in the data?
+        """
+        index = self.lower_bound(target)
+        return index < len(self.lyst) and self.lyst[index] == target
+
+    def report(self):
+        """
+        Returns the size and error of the model
+
+        Returns:
+        --------
+        (dict): The number of keys and segments, the size of the
+            model in bytes and the fitted and actual maximum errors
+        """
+        if isinstance(self._keys, array.array):
+            key_bytes = self._keys.itemsize * len(self._keys)
+        else:
+            key_bytes = sum(sys.getsizeof(key) for key in self._keys)
+
+        line_bytes = self._slopes.itemsize * len(self._slopes) * 2
+
+        return {
+            "keys": len(self.lyst),
+            "segments": len(self._keys),
+            "model_bytes": key_bytes + line_bytes,
+            "error": self.error,
+            "max_error": self.max_error,
+        }
+
+    def __len__(self):
+        """
+        Returns the number of keys in the data
+        """
+        return len(self.lyst)
+
+    def __repr__(self):
+        """
+        Return a string of self
+        """
+        return (f"LearnedIndex({len(self.lyst)} keys, {len(self._keys)} segments, "
+                f"max_error={self.max_error})")
@@ -0,0 +1,300 @@
+"""
+parallel_search.py
+Contains a parallel linear search for unsorted data.
+A SharedScan copies the data once into shared memory as 8 byte integers
+and starts a process pool. Each find() splits the data into chunks and
+scans them across the pool. Once a chunk finds target, the chunks after
+it are cancelled, and the first matching index is returned.
+"""
+import array
+import multiprocessing
+import operator
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+# Data shorter than this is scanned in this process; a pool costs more
+PARALLEL_THRESHOLD = 1_000_000
+
+# The number of values a worker scans between checks for an earlier hit
+BLOCK_SIZE = 1 << 16
+
+# Set in each worker process by _init_worker(): the chunk number of the
+# earliest hit so far, shared with every worker, the shared memory block
+# and its values
+_FIRST_HIT = None
+_MEMORY = None
+_VALUES = None
+
+# Buffer formats that are already 8 byte integers, so they can be
+# copied into shared memory byte for byte
+INTEGER_FORMATS = ("q", "l")
+
+
+def _init_worker(first_hit, name):
+    """
+    Used as the process pool initializer.
+    Gives each worker the shared chunk number of the earliest hit, and
+    attaches it to the shared memory block once for every query.
+
+    Parameters
+    ----------
+    first_hit : multiprocessing.Value
+        The chunk number of the earliest hit so far
+    name : str
+        The name of the shared memory block
+    """
+    global _FIRST_HIT, _MEMORY, _VALUES  # pylint: disable=global-statement
+    _FIRST_HIT = first_hit
+    # The block stays attached until the worker exits
+    _MEMORY = shared_memory.SharedMemory(name=name)
+    _VALUES = _MEMORY.buf.cast("q")
+
+
+def _scan_chunk(start, stop, target, chunk):
+    """
+    Used in SharedScan.find(). Runs in a worker process.
+    Scans values[start:stop] of the shared memory block for target,
+    a block at a time, giving up if an earlier chunk finds it first.
+
+    Parameters
+    ----------
+    start : int
+        The first index of the chunk
+    stop : int
+        One past the last index of the chunk
+    target : int
+        The value being searched for
+    chunk : int
+        The number of this chunk
+
+    Returns
+    -------
+    (int): The first index of target in the chunk, or -1
+    """
+    for low in range(start, stop, BLOCK_SIZE):
+        # An earlier chunk already has a hit, so this one can't be first
+        if _FIRST_HIT.value < chunk:
+            return -1
+
+        with _VALUES[low:min(low + BLOCK_SIZE, stop)] as block:
+            try:
+                return low + block.tolist().index(target)
+            except ValueError:
+                pass
+    return -1
+
+
+def _find(lyst, target):
+    """
+    Used in parallel_find().
+    Scans lyst for target in this process.
+
+    Parameters
+    ----------
+    lyst : Sequence
+        The data being searched
+    target : int
+        The value being searched for
+
+    Returns
+    -------
+    (int): The first index of target, or -1
+    """
+    try:
+        # Works on any sequence, including a NumPy array, which has no index()
+        return operator.indexOf(lyst, target)
+    except ValueError:
+        return -1
+
+
+class SharedScan:
+    """
+    Unsorted data held in shared memory, with a pool of worker processes
+    ready to scan it. The data is copied into shared memory once, when
+    the SharedScan is made, so every find() after that only scans.
+
+    Attributes:
+    -----------
+    length : int
+        The number of values
+    workers : int
+        The number of worker processes
+
+    Methods:
+    --------
+    find(target): The first index of target, or -1
+    close(): Stops the workers and frees the shared memory
+    """
+
+    def __init__(self, data, workers=None):
+        """
+        Constructor for SharedScan
+
+        Parameters:
+        -----------
+        data : Sequence | buffer
+            The unsorted values. An array("q"), or any buffer of 8 byte
+            integers (like an int64 NumPy array), is copied byte for
+            byte; anything else is converted to 8 byte integers first
+        workers : int
+            The number of worker processes. Defaults to the number of cores
+
+        Raises:
+        -------
+        TypeError: If the values aren't all 8 byte integers
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.length = len(data)
+
+        source = _integer_buffer(data)
+        self._memory = shared_memory.SharedMemory(create=True, size=max(1, source.nbytes))
+        try:
+            self._memory.buf[:source.nbytes] = source.cast("B")
+        finally:
+            source.release()
+
+        # More chunks than workers, so there is work left to cancel after a hit
+        self._chunk_count = self.workers * 4
+        self._chunk_size = max(1, -(-self.length // self._chunk_count))
+        self._first_hit = multiprocessing.Value("q", self._chunk_count)
+        self._executor = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                             initargs=(self._first_hit, self._memory.name))
+
+    def find(self, target):
+        """
+        Finds the first index of target, scanning chunks on every worker.
+        Once a chunk finds target, the chunks after it are cancelled.
+
+        Parameters:
+        -----------
+        target : int
+            The value being searched for
+
+        Returns:
+        --------
+        (int): The first index of target, or -1 if it isn't there
+        """
+        self._first_hit.value = self._chunk_count
+        futures = {}
+        for start in range(0, self.length, self._chunk_size):
+            chunk = len(futures)
+            stop = min(start + self._chunk_size, self.length)
+            futures[self._executor.submit(_scan_chunk, start, stop, target, chunk)] = chunk
+
+        result = -1
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+
+            chunk = futures[future]
+            index = future.result()
+            if index == -1 or chunk > self._first_hit.value:
+                continue
+
+            # The earliest hit so far; drop every chunk after it
+            result = index
+            self._first_hit.value = chunk
+            for other, other_chunk in futures.items():
+                if other_chunk > chunk:
+                    other.cancel()
+        return result
+
+    def __len__(self):
+        """
+        Returns the number of values
+        """
+        return self.length
+
+    def __enter__(self):
+        """
+        Allows SharedScan to be used in a with statement
+        """
+        return self
+
+    def __exit__(self, *args):
+        """
+        Closes the SharedScan at the end of a with statement
+        """
+        self.close()
+
+    def close(self):
+        """
+        Stops the workers and frees the shared memory
+        """
+        self._executor.shutdown()
+        self._memory.close()
+        self._memory.unlink()
+
+    def __repr__(self):
+        """
+        Return a string of self
+        """
+        return f"SharedScan({self.length} values, {self.workers} workers)"
+
+
+def _integer_buffer(data):
+    """
+    Used in SharedScan().
+    Returns a memoryview of data as 8 byte integers, without copying
+    data if it already is a buffer of them.
+
+    Parameters
+    ----------
+    data : Sequence | buffer
+        The values
+
+    Returns
+    -------
+    (memoryview): The values as 8 byte integers
+
+    Raises
+    ------
+    TypeError: If the values aren't all 8 byte integers
+    """
+    try:
+        view = memoryview(data)
+    except TypeError:
+        pass
+    else:
+        if view.format in INTEGER_FORMATS and view.itemsize == 8 and view.c_contiguous:
+            return view
+        view.release()
+
+    try:
+        return memoryview(array.array("q", data))
+    except OverflowError as error:
+        raise TypeError("SharedScan needs 8 byte integers") from error
+
+
+def parallel_find(lyst, target, workers=None):
+    """
+    Finds the first index of target in unsorted data, using every core.
+    Each call copies the data into shared memory, which for a list costs
+    more than one serial scan; to search the same data more than once,
+    make a SharedScan and call its find() instead.
+
+    Parameters
+    ----------
+    lyst : Sequence
+        The unsorted data being searched. Data that isn't all
+        8 byte integers is scanned in this process instead
+    target : int
+        The value being searched for
+    workers : int
+        The number of worker processes. Defaults to the number of cores
+
+    Returns
+    -------
+    (int): The first index of target in lyst, or -1 if it isn't there
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(lyst) < PARALLEL_THRESHOLD:
+        return _find(lyst, target)
+
+    try:
+        scan = SharedScan(lyst, workers)
+    except TypeError:
+        return _find(lyst, target)
+    with scan:
+        return scan.find(target)
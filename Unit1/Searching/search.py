@@ -1,12 +1,37 @@
 """
-Contains three different searching algorithms:
+Contains five different searching algorithms:
   - A linear search algorithm
-  - A binary search algorithm (Recursive)
-  - A jump search algorithm (Recursive)
+  - A binary search algorithm (Iterative, over index bounds)
+  - A jump search algorithm (Iterative, over index bounds)
+  - An interpolation search algorithm (For near-uniform keys)
+  - An exponential search algorithm (For targets near the front)
+AutoSearch samples a dataset once and picks between them, and
+Finger searches runs of nearby targets starting from the last answer.
 Compares the time it takes to run each algorithm.
+
+The binary search is built on a small index-bound engine:
+  - lower_bound(): First index whose value is not less than target
+  - upper_bound(): First index whose value is greater than target
+  - contains(): Is target in the sorted sequence?
+  - index_of(): The index of target in the sorted sequence
+None of these copy the sequence, so they run in O(log n) on any
+sorted object that supports len() and indexing.
+
+search_many() answers a whole batch of targets against one sorted
+dataset, using NumPy's searchsorted when the data is a NumPy array.
+
+count_range(), iter_range() and range_view() work with the keys in a
+half-open range [low, high) without copying them into a new list.
 """
+import bisect
+import numbers
 import time
 
+try:
+    import numpy
+except ImportError:  # NumPy is optional; only search_many() uses it
+    numpy = None
+
 
 def time_it(func):
     """
@@ -93,10 +118,348 @@ def test_jump_search():
     assert not jump_search(lyst, -1)
 
 
+def lower_bound(lyst, target, low=0, high=None):
+    """
+    Finds the first index in lyst[low:high] whose value is not less
+    than target. Works on index bounds over lyst, so nothing is copied.
+
+    Parameters
+    ----------
+    lyst : Sequence
+        A sorted sequence supporting len() and indexing
+    target : int
+        The value being searched for
+    low : int
+        The first index of the search range
+    high : int
+        One past the last index of the search range. Defaults to len(lyst)
+
+    Returns
+    -------
+    (int): The insertion point for target that keeps lyst sorted
+    """
+    if high is None:
+        high = len(lyst)
+    # bisect narrows [low, high) in a loop; no slices, no recursion
+    return bisect.bisect_left(lyst, target, low, high)
+
+
+def upper_bound(lyst, target, low=0, high=None):
+    """
+    Finds the first index in lyst[low:high] whose value is greater
+    than target.
+
+    Parameters
+    ----------
+    lyst : Sequence
+        A sorted sequence supporting len() and indexing
+    target : int
+        The value being searched for
+    low : int
+        The first index of the search range
+    high : int
+        One past the last index of the search range. Defaults to len(lyst)
+
+    Returns
+    -------
+    (int): The insertion point after any values equal to target
+    """
+    if high is None:
+        high = len(lyst)
+    return bisect.bisect_right(lyst, target, low, high)
+
+
+def contains(lyst, target):
+    """
+    Checks if target is in a sorted sequence
+
+    Parameters
+    ----------
+    lyst : Sequence
+        A sorted sequence supporting len() and indexing
+    target : int
+        The value being searched for
+
+    Returns
+    -------
+    (Boolean): Is target in lyst?
+    """
+    index = lower_bound(lyst, target)
+    return index < len(lyst) and lyst[index] == target
+
+
+def index_of(lyst, target):
+    """
+    Returns the index of the first occurrence of target in a sorted sequence
+
+    Parameters
+    ----------
+    lyst : Sequence
+        A sorted sequence supporting len() and indexing
+    target : int
+        The value being searched for
+
+    Returns
+    -------
+    (int): The index of target
+
+    Raises
+    ------
+    ValueError: If target is not in lyst
+    """
+    index = lower_bound(lyst, target)
+    if index < len(lyst) and lyst[index] == target:
+        return index
+    raise ValueError(f"{target} is not in the sequence")
+
+
+def search_many(sorted_data, targets, positions=False):
+    """
+    Searches for many targets in the same sorted dataset at once.
+    The targets are visited in sorted order, and each search starts
+    where the previous one stopped, so the whole batch is one walk
+    over the data. If sorted_data is a NumPy array the batch is
+    handed to numpy.searchsorted instead.
+
+    Parameters
+    ----------
+    sorted_data : Sequence
+        A sorted sequence supporting len() and indexing
+    targets : Iterable
+        The values being searched for. They do not need to be sorted
+    positions : Boolean
+        If True, return the index of each target (-1 if missing)
+        rather than whether it was found
+
+    Returns
+    -------
+    (List | numpy.ndarray): One entry per target, in the order given.
+        A NumPy array if sorted_data is a NumPy array.
+    """
+    if numpy is not None and isinstance(sorted_data, numpy.ndarray):
+        return _search_many_numpy(sorted_data, targets, positions)
+
+    targets = list(targets)
+    length = len(sorted_data)
+    results = [-1 if positions else False] * len(targets)
+
+    low = 0  # Every remaining target is at least as big as this position
+    for i in sorted(range(len(targets)), key=targets.__getitem__):
+        target = targets[i]
+        low = lower_bound(sorted_data, target, low, length)
+        if low < length and sorted_data[low] == target:
+            results[i] = low if positions else True
+
+    return results
+
+
+def _search_many_numpy(sorted_data, targets, positions):
+    """
+    Used in search_many().
+    Vectorized batch search over a sorted NumPy array.
+
+    Parameters
+    ----------
+    sorted_data : numpy.ndarray
+        A sorted one-dimensional array
+    targets : Iterable
+        The values being searched for
+    positions : Boolean
+        If True, return indices (-1 if missing) instead of booleans
+
+    Returns
+    -------
+    (numpy.ndarray): One entry per target, in the order given
+    """
+    if not isinstance(targets, numpy.ndarray):
+        # asarray() would wrap a generator in a 0-d object array
+        targets = list(targets)
+    targets = numpy.asarray(targets)
+    indices = numpy.searchsorted(sorted_data, targets)
+
+    if len(sorted_data) == 0:
+        found = numpy.zeros(targets.shape, dtype=bool)
+    else:
+        # Indices past the end can't be a hit; clip them so they can be compared
+        clipped = numpy.minimum(indices, len(sorted_data) - 1)
+        found = sorted_data[clipped] == targets
+
+    if positions:
+        return numpy.where(found, indices, -1)
+    return found
+
+
+def _range_bounds(lyst, low, high):
+    """
+    Used in the range functions.
+    Finds the index bounds of the keys in [low, high).
+
+    Parameters
+    ----------
+    lyst : Sequence
+        A sorted sequence supporting len() and indexing
+    low : int
+        The smallest key in the range
+    high : int
+        One past the largest key in the range
+
+    Returns
+    -------
+    (tuple): (start, stop) such that lyst[start:stop] is the range
+    """
+    start = lower_bound(lyst, low)
+    if high <= low:
+        return start, start
+    return start, lower_bound(lyst, high, start)
+
+
+def count_range(lyst, low, high):
+    """
+    Counts the keys in [low, high) in O(log n)
+
+    Parameters
+    ----------
+    lyst : Sequence
+        A sorted sequence supporting len() and indexing
+    low : int
+        The smallest key in the range
+    high : int
+        One past the largest key in the range
+
+    Returns
+    -------
+    (int): The number of keys in the range
+    """
+    start, stop = _range_bounds(lyst, low, high)
+    return stop - start
+
+
+def iter_range(lyst, low, high):
+    """
+    Iterates through the keys in [low, high), smallest first
+
+    Parameters
+    ----------
+    lyst : Sequence
+        A sorted sequence supporting len() and indexing
+    low : int
+        The smallest key in the range
+    high : int
+        One past the largest key in the range
+
+    Yields
+    ------
+    The keys in the range
+    """
+    start, stop = _range_bounds(lyst, low, high)
+    for i in range(start, stop):
+        yield lyst[i]
+
+
+def range_view(lyst, low, high):
+    """
+    Returns a zero-copy view of the keys in [low, high).
+    NumPy arrays give a NumPy view, objects that support the buffer
+    protocol (array.array, memoryview) give a memoryview, and anything
+    else (like a list) gives a RangeView over lyst.
+
+    Parameters
+    ----------
+    lyst : Sequence
+        A sorted sequence supporting len() and indexing
+    low : int
+        The smallest key in the range
+    high : int
+        One past the largest key in the range
+
+    Returns
+    -------
+    (Sequence): A view of the keys in the range
+    """
+    start, stop = _range_bounds(lyst, low, high)
+
+    if numpy is not None and isinstance(lyst, numpy.ndarray):
+        return lyst[start:stop]
+    if not isinstance(lyst, (list, tuple)):
+        try:
+            return memoryview(lyst)[start:stop]
+        except TypeError:
+            pass
+    return RangeView(lyst, start, stop)
+
+
+class RangeView:
+    """
+    A read-only view of lyst[start:stop] that doesn't copy lyst
+
+    Attributes:
+    -----------
+    lyst : Sequence
+        The sequence being viewed
+    start : int
+        The first index of the view
+    stop : int
+        One past the last index of the view
+    """
+
+    def __init__(self, lyst, start, stop):
+        """
+        Constructor for RangeView
+
+        Parameters:
+        -----------
+        lyst : Sequence
+            The sequence being viewed
+        start : int
+            The first index of the view
+        stop : int
+            One past the last index of the view
+        """
+        self.lyst = lyst
+        self.start = start
+        self.stop = stop
+
+    def __len__(self):
+        """
+        Returns the number of keys in the view
+        """
+        return self.stop - self.start
+
+    def __getitem__(self, index):
+        """
+        Returns the key at index in the view. A slice returns a smaller RangeView
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("RangeView slices can't have a step")
+            return RangeView(self.lyst, self.start + start, self.start + max(start, stop))
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("RangeView index out of range")
+        return self.lyst[self.start + index]
+
+    def __iter__(self):
+        """
+        Iterates through the keys in the view
+        """
+        for i in range(self.start, self.stop):
+            yield self.lyst[i]
+
+    def __repr__(self):
+        """
+        Return a string of self
+        """
+        return f"RangeView({self.start}:{self.stop} of {len(self.lyst)} keys)"
+
+
 @time_it
-def linear_search(lyst, target):
+def linear_search(lyst, target, is_sorted=True):
     """
     Performs a linear search for target in a given list.
+    See parallel_search.parallel_find() to scan unsorted data on every core.
 
     Parameters
     ----------
@@ -104,6 +467,9 @@ def linear_search(lyst, target):
         A sorted list
     target : int
         The target of the search
+    is_sorted : Boolean
+        Is lyst sorted? If not, the search can't stop early
+        when it passes target
 
     Returns
     -------
@@ -113,16 +479,16 @@ def linear_search(lyst, target):
     for i in lyst:
         if i == target:
             return True
-        elif i > target:
+        elif is_sorted and i > target:
             return False
-        i += 1
     return False
 
 
 def _binary_search(lyst, target):
     """
     Performs a binary search on a list.
-    This function is recursive.
+    The search narrows a pair of index bounds over lyst rather
+    than slicing it, so no data is copied.
 
     Parameters
     ----------
@@ -135,22 +501,13 @@ def _binary_search(lyst, target):
     -------
     (Boolean): Is target in lyst?
     """
-    mid = len(lyst) // 2
-
-    if len(lyst) == 0:
-        return False
-    elif lyst[mid] == target:
-        return True
-    elif lyst[mid] > target:
-        return _binary_search(lyst[:mid], target)
-    else:
-        return _binary_search(lyst[mid+1:len(lyst)], target)
+    return contains(lyst, target)
 
 
 @time_it
 def binary_search(lyst, target):
     """
-    Recursive helper function for _binary_search().
+    Helper function for _binary_search().
     Allows for timing the function
     Parameters
     ----------
@@ -168,53 +525,56 @@ def binary_search(lyst, target):
 
 def _jump_search(lyst, target):
     """
-    Performs a recursive jump search on a list. It works by dividing the list into 10 segments.
-    For each segment, perform another jump search if target is within the first and last value.
-    Repeat this process until there are not enough values for a jump search; perform a linear search
-    on the remaining values.
-    The
+    Performs a jump search on a list. It works by dividing the list into 10 segments.
+    Jump through the segments until one ends past target, then repeat the process
+    on that segment. Repeat this process until there are not enough values for a jump
+    search; perform a linear search on the remaining values.
+    Each segment is tracked as a pair of index bounds over lyst, so nothing is copied.
+    See jump_index.JumpIndex for a reusable index over the jump points.
+
     Parameters
     ----------
-    lyst
-    target
+    lyst : List
+        The sorted list being searched
+    target : int
+        The item we are searching for in the list
 
     Returns
     -------
     (boolean): Is target in lyst?
     """
-    length = len(lyst)  # The length of the list
-    jump_length = length // 10  # The jump length. The number of jumps to be performed
-
-    if jump_length == 0:  # If there are not enough items in lyst to perform a jump sort
-        # Do a linear search of the values
-        for i in lyst:
-            if i == target:
-                return True
-        return False
-
-    previous = 0  # The previous index of the sort
-    for i in range(1, 11):
-        # The actual jump sorting
-        current = i * jump_length  # The current index of the sort
-        if current > length - 1:  # If the current index is larger than the actual lyst
-            # Perform a jump sort with the last values of lyst
-            return _jump_search(lyst[previous:length], target)
-
-        elif lyst[current] == target:  # If the current index is the target
-            return True
+    low = 0  # The first index of the current segment
+    high = len(lyst)  # One past the last index of the current segment
+
+    while True:
+        jump_length = (high - low) // 10  # The jump length
 
-        elif lyst[current] > target:  # If the current index is LARGER than the target
-            # Perform a recursive jump search from the previous index to the current index
-            return _jump_search(lyst[previous:current], target)
+        if jump_length == 0:  # If there are not enough items to perform a jump search
+            # Do a linear search of the values
+            for i in range(low, high):
+                if lyst[i] == target:
+                    return True
+            return False
+
+        previous = low  # The previous index of the search
+        current = low + jump_length  # The current index of the search
+        # Jump until the current index is past the end or not less than target
+        while current < high and lyst[current] < target:
+            previous = current
+            current += jump_length
+
+        if current < high and lyst[current] == target:  # If the current index is the target
+            return True
 
-        # Update the previous index
-        previous = current
+        # Search the segment between the previous and current index
+        low = previous
+        high = min(current, high)
 
 
 @time_it
 def jump_search(lyst, target):
     """
-    A recursive helper function for _jump_search().
+    A helper function for _jump_search().
     Allows for timing of the function.
     Parameters
     ----------
@@ -230,6 +590,385 @@ def jump_search(lyst, target):
     return _jump_search(lyst, target)
 
 
+def _interpolation_bound(lyst, target, low, high):
+    """
+    Used in _interpolation_search() and AutoSearch.
+    Finds the lower bound of target in lyst[low:high] by guessing its
+    position from the values at each end of the range. Near-uniform keys
+    take O(log log n) guesses. The guesses are capped at log2(n), after
+    which a binary search finishes the job, so the search never gets
+    worse than O(log n).
+
+    Parameters
+    ----------
+    lyst : Sequence
+        A sorted sequence of numbers
+    target : int
+        The value being searched for
+    low : int
+        The first index of the search range
+    high : int
+        One past the last index of the search range
+
+    Returns
+    -------
+    (int): The first index whose value is not less than target
+    """
+    budget = (high - low).bit_length()  # The number of guesses allowed
+
+    # The answer always stays within [low, high]
+    while low < high and budget > 0:
+        budget -= 1
+        first = lyst[low]
+        last = lyst[high - 1]
+
+        if target <= first:
+            return low
+        if target > last:
+            return high
+
+        # first < target <= last, so the answer is in [low + 1, high - 1]
+        guess = low + 1 + int((target - first) * (high - 2 - low) // (last - first))
+        if lyst[guess] < target:
+            low = guess + 1
+        else:
+            low += 1
+            high = guess + 1
+
+    return lower_bound(lyst, target, low, high)
+
+
+def _exponential_bound(lyst, target, low, high):
+    """
+    Used in _exponential_search() and AutoSearch.
+    Finds the lower bound of target in lyst[low:high] by probing at
+    low + 1, 2, 4, 8, ... until it passes target, then binary searching
+    the last gap. Takes O(log d) steps where d is how far target is
+    from low, so targets near the front are found quickly.
+
+    Parameters
+    ----------
+    lyst : Sequence
+        A sorted sequence supporting len() and indexing
+    target : int
+        The value being searched for
+    low : int
+        The first index of the search range
+    high : int
+        One past the last index of the search range
+
+    Returns
+    -------
+    (int): The first index whose value is not less than target
+    """
+    offset = 1
+    # Double the offset until its last value is not less than target
+    while low + offset - 1 < high and lyst[low + offset - 1] < target:
+        offset *= 2
+
+    # Everything before the previous probe is less than target
+    return lower_bound(lyst, target, low + offset // 2, min(low + offset, high))
+
+
+def _exponential_bound_left(lyst, target, low, high):
+    """
+    Used in Finger.
+    The mirror image of _exponential_bound(): finds the lower bound of
+    target in lyst[low:high] by probing at high - 1, 2, 4, 8, ... until
+    it finds a value less than target. Takes O(log d) steps where d is
+    how far target is from high.
+
+    Parameters
+    ----------
+    lyst : Sequence
+        A sorted sequence supporting len() and indexing
+    target : int
+        The value being searched for
+    low : int
+        The first index of the search range
+    high : int
+        One past the last index of the search range. Every value
+        from high on must be not less than target
+
+    Returns
+    -------
+    (int): The first index whose value is not less than target
+    """
+    offset = 1
+    # Double the offset until its value is less than target
+    while high - offset >= low and lyst[high - offset] >= target:
+        offset *= 2
+
+    # Everything from the previous probe on is not less than target
+    return lower_bound(lyst, target, max(high - offset + 1, low), high - offset // 2)
+
+
+def _interpolation_search(lyst, target):
+    """
+    Performs an interpolation search on a list of numbers.
+
+    Parameters
+    ----------
+    lyst : List
+        The sorted list being searched
+    target : int
+        The item we are searching for in the list
+
+    Returns
+    -------
+    (Boolean): Is target in lyst?
+    """
+    index = _interpolation_bound(lyst, target, 0, len(lyst))
+    return index < len(lyst) and lyst[index] == target
+
+
+@time_it
+def interpolation_search(lyst, target):
+    """
+    Helper function for _interpolation_search().
+    Allows for timing the function.
+
+    Parameters
+    ----------
+    lyst : List
+        The sorted list being searched
+    target : int
+        The target in the list
+
+    Returns
+    -------
+    Boolean: Is target in lyst?
+    """
+    return _interpolation_search(lyst, target)
+
+
+def _exponential_search(lyst, target):
+    """
+    Performs an exponential (galloping) search on a list.
+
+    Parameters
+    ----------
+    lyst : List
+        The sorted list being searched
+    target : int
+        The item we are searching for in the list
+
+    Returns
+    -------
+    (Boolean): Is target in lyst?
+    """
+    index = _exponential_bound(lyst, target, 0, len(lyst))
+    return index < len(lyst) and lyst[index] == target
+
+
+@time_it
+def exponential_search(lyst, target):
+    """
+    Helper function for _exponential_search().
+    Allows for timing the function.
+
+    Parameters
+    ----------
+    lyst : List
+        The sorted list being searched
+    target : int
+        The target in the list
+
+    Returns
+    -------
+    Boolean: Is target in lyst?
+    """
+    return _exponential_search(lyst, target)
+
+
+class AutoSearch:
+    """
+    Picks the fastest search strategy for one sorted dataset.
+    The data is sampled once when the AutoSearch is made:
+      - Near-uniform numeric keys use interpolation search
+      - Front-biased queries use exponential search
+      - Everything else uses binary search
+    Every strategy is O(log n) or better in the worst case.
+
+    Attributes:
+    -----------
+    lyst : Sequence
+        The sorted data being searched
+    strategy : str
+        The strategy picked: "interpolation", "exponential" or "binary"
+
+    Methods:
+    --------
+    lower_bound(target): The first index whose value is not less than target
+    contains(target): Is target in the data?
+    """
+
+    SAMPLE_SIZE = 64  # The number of keys sampled from the data
+    TOLERANCE = 0.01  # The largest sampled error, as a fraction of the length
+
+    def __init__(self, lyst, front_biased=False):
+        """
+        Constructor for AutoSearch
+
+        Parameters:
+        -----------
+        lyst : Sequence
+            A sorted sequence supporting len() and indexing
+        front_biased : Boolean
+            Do most queries land near the front of the data?
+        """
+        self.lyst = lyst
+
+        if front_biased:
+            self.strategy = "exponential"
+        elif self._is_uniform():
+            self.strategy = "interpolation"
+        else:
+            self.strategy = "binary"
+
+        self._bound = {
+            "interpolation": _interpolation_bound,
+            "exponential": _exponential_bound,
+            "binary": lower_bound,
+        }[self.strategy]
+
+    def _is_uniform(self):
+        """
+        Checks if the keys are close enough to evenly spaced for
+        interpolation to pay off, by comparing where sampled keys are
+        with where a straight line from the first to last key puts them.
+
+        Returns
+        -------
+        (Boolean): Are the keys near-uniform?
+        """
+        length = len(self.lyst)
+        if length < 2:
+            return False
+
+        first = self.lyst[0]
+        last = self.lyst[-1]
+        # numbers.Real also covers NumPy's integer and float scalars
+        if not isinstance(first, numbers.Real) or last == first:
+            return False
+
+        step = max(1, length // self.SAMPLE_SIZE)
+        for index in range(0, length, step):
+            predicted = (self.lyst[index] - first) * (length - 1) / (last - first)
+            if abs(predicted - index) > length * self.TOLERANCE:
+                return False
+        return True
+
+    def lower_bound(self, target):
+        """
+        Finds the first index whose value is not less than target
+
+        Parameters:
+        -----------
+        target : int
+            The value being searched for
+
+        Returns:
+        --------
+        (int): The insertion point for target
+        """
+        return self._bound(self.lyst, target, 0, len(self.lyst))
+
+    def contains(self, target):
+        """
+        Checks if target is in the data
+
+        Parameters:
+        -----------
+        target : int
+            The value being searched for
+
+        Returns:
+        --------
+        (Boolean): Is target in the data?
+        """
+        index = self.lower_bound(target)
+        return index < len(self.lyst) and self.lyst[index] == target
+
+
+class Finger:
+    """
+    A stateful searcher for runs of nearby targets. It remembers where
+    the last search ended and gallops outward from there, so a search
+    costs O(log d), where d is how far the answer is from the last one,
+    rather than O(log n).
+
+    Attributes:
+    -----------
+    lyst : Sequence
+        The sorted data being searched
+    position : int
+        The index the last search ended at
+
+    Methods:
+    --------
+    lower_bound(target): The first index whose value is not less than target
+    contains(target): Is target in the data?
+    """
+
+    def __init__(self, lyst, position=0):
+        """
+        Constructor for Finger
+
+        Parameters:
+        -----------
+        lyst : Sequence
+            A sorted sequence supporting len() and indexing
+        position : int
+            The index the first search starts from
+        """
+        self.lyst = lyst
+        self.position = position
+
+    def lower_bound(self, target):
+        """
+        Finds the first index whose value is not less than target,
+        starting from where the last search ended
+
+        Parameters:
+        -----------
+        target : int
+            The value being searched for
+
+        Returns:
+        --------
+        (int): The insertion point for target
+        """
+        length = len(self.lyst)
+        finger = min(self.position, length)
+
+        if finger < length and self.lyst[finger] < target:
+            # Target is to the right of the finger
+            index = _exponential_bound(self.lyst, target, finger + 1, length)
+        else:
+            # Target is at or to the left of the finger
+            index = _exponential_bound_left(self.lyst, target, 0, finger)
+
+        self.position = index
+        return index
+
+    def contains(self, target):
+        """
+        Checks if target is in the data
+
+        Parameters:
+        -----------
+        target : int
+            The value being searched for
+
+        Returns:
+        --------
+        (Boolean): Is target in the data?
+        """
+        index = self.lower_bound(target)
+        return index < len(self.lyst) and self.lyst[index] == target
+
+
 def main():
     """
     The main function for search.py.
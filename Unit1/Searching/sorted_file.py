@@ -0,0 +1,183 @@
+"""
+sorted_file.py
+Contains a compact on-disk format for sorted fixed-width integers.
+
+The file is a 16 byte header followed by the raw integers:
+  - 4 bytes: The magic string b"SRTD"
+  - 1 byte: The width of each integer in bytes (1, 2, 4 or 8)
+  - 1 byte: The byte order of the integers (0 little, 1 big)
+  - 2 bytes: Padding
+  - 8 bytes: The number of integers (little-endian)
+
+write_sorted_file() streams values into the format, and SortedFile
+maps a file back into memory. SortedFile behaves like a read-only
+sorted list, so the searches in search.py run directly against it and
+only the pages they touch are read from disk.
+"""
+import array
+import mmap
+import struct
+import sys
+
+MAGIC = b"SRTD"
+HEADER = struct.Struct("<4sBBxxQ")
+
+# The array/memoryview type code for each supported integer width
+TYPECODES = {1: "b", 2: "h", 4: "i", 8: "q"}
+
+# The byte order flag for each value of sys.byteorder
+BYTE_ORDERS = {"little": 0, "big": 1}
+
+# The number of values buffered before they are written to disk
+CHUNK_SIZE = 1 << 16
+
+
+def write_sorted_file(path, values, width=8):
+    """
+    Writes a sorted stream of integers to a file. The values are
+    written in chunks, so the stream never has to fit in memory.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file to write
+    values : Iterable
+        The integers to write, smallest to largest
+    width : int
+        The width of each integer in bytes (1, 2, 4 or 8)
+
+    Returns
+    -------
+    (int): The number of integers written
+
+    Raises
+    ------
+    ValueError: If width is not supported or values are not sorted
+    OverflowError: If a value does not fit in width bytes
+    """
+    if width not in TYPECODES:
+        raise ValueError(f"width must be one of {sorted(TYPECODES)}")
+    typecode = TYPECODES[width]
+
+    count = 0
+    previous = None
+    with open(path, "wb") as file:
+        # Reserve the header; the count is filled in once it is known
+        file.write(HEADER.pack(MAGIC, width, BYTE_ORDERS[sys.byteorder], 0))
+
+        chunk = array.array(typecode)
+        for value in values:
+            if previous is not None and value < previous:
+                raise ValueError("values must be sorted smallest to largest")
+            previous = value
+            chunk.append(value)
+
+            if len(chunk) == CHUNK_SIZE:
+                chunk.tofile(file)
+                count += len(chunk)
+                chunk = array.array(typecode)
+
+        chunk.tofile(file)
+        count += len(chunk)
+
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, width, BYTE_ORDERS[sys.byteorder], count))
+
+    return count
+
+
+class SortedFile:
+    """
+    A read-only, memory-mapped view of a file made by write_sorted_file().
+    Supports len(), indexing, zero-copy slicing and iteration, so it can
+    be passed to any of the search functions in place of a list.
+
+    Attributes:
+    -----------
+    path : str
+        The path of the mapped file
+    width : int
+        The width of each integer in bytes
+
+    Methods:
+    --------
+    close(): Unmaps the file
+    """
+
+    def __init__(self, path):
+        """
+        Constructor for SortedFile
+
+        Parameters:
+        -----------
+        path : str
+            The path of a file made by write_sorted_file()
+
+        Raises:
+        -------
+        ValueError: If the file is not a sorted file for this platform
+        """
+        self.path = path
+
+        with open(path, "rb") as file:
+            header = file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError(f"{path} is not a sorted file")
+
+            magic, self.width, byte_order, count = HEADER.unpack(header)
+            if magic != MAGIC or self.width not in TYPECODES:
+                raise ValueError(f"{path} is not a sorted file")
+            if byte_order != BYTE_ORDERS[sys.byteorder]:
+                raise ValueError(f"{path} was written with a different byte order")
+
+            # The mapping stays valid after the file object is closed
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        end = HEADER.size + count * self.width
+        with memoryview(self._mmap) as raw:
+            self._values = raw[HEADER.size:end].cast(TYPECODES[self.width])
+
+    def __len__(self):
+        """
+        Returns the number of integers in the file
+        """
+        return len(self._values)
+
+    def __getitem__(self, index):
+        """
+        Returns the integer at index. A slice returns a
+        zero-copy memoryview over the same mapping.
+        """
+        return self._values[index]
+
+    def __iter__(self):
+        """
+        Iterates through the integers in order
+        """
+        return iter(self._values)
+
+    def __enter__(self):
+        """
+        Allows SortedFile to be used in a with statement
+        """
+        return self
+
+    def __exit__(self, *args):
+        """
+        Unmaps the file at the end of a with statement
+        """
+        self.close()
+
+    def close(self):
+        """
+        Unmaps the file. Any slices taken from this
+        SortedFile must be released first.
+        """
+        self._values.release()
+        self._mmap.close()
+
+    def __repr__(self):
+        """
+        Return a string of self
+        """
+        return f"SortedFile({self.path!r}, {len(self)} values)"
@@ -0,0 +1,45 @@
+import pytest
+from random import seed, sample
+from search import _jump_search
+from bloom import BloomFilter, FilteredSearch
+
+DATA_SIZE = 50000
+
+
+def make_data():
+    seed(0)
+    data = sample(range(DATA_SIZE * 3), k=DATA_SIZE)
+    data.sort()
+    while True:
+        yield data
+
+
+def test_bloom_filter():
+    data = next(make_data())
+    bloom = BloomFilter(len(data), error_rate=0.01)
+    bloom.update(data)
+
+    assert all(key in bloom for key in data)
+
+    misses = range(DATA_SIZE * 3, DATA_SIZE * 5)
+    false_positives = sum(key in bloom for key in misses)
+    assert false_positives < len(misses) * 0.02
+    assert bloom.memory() < DATA_SIZE * 2
+
+    with pytest.raises(ValueError):
+        BloomFilter(10, error_rate=0)
+
+
+def test_filtered_search():
+    data = next(make_data())
+    present = set(data)
+
+    for searcher in (FilteredSearch(data), FilteredSearch(data, search=_jump_search)):
+        for target in range(0, DATA_SIZE * 3, 7):
+            assert searcher.contains(target) == (target in present)
+
+        report = searcher.report()
+        assert report["lookups"] == len(range(0, DATA_SIZE * 3, 7))
+        assert report["hits"] == sum(target in present for target in range(0, DATA_SIZE * 3, 7))
+        assert report["rejected"] > report["false_positives"] * 10
+        assert report["memory_bytes"] == searcher.bloom.memory()
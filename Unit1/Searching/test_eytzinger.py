@@ -0,0 +1,47 @@
+from random import seed, sample
+from search import lower_bound
+from eytzinger import EytzingerArray, benchmark
+
+DATA_SIZE = 100000
+
+
+def make_data():
+    seed(0)
+    data = sample(range(DATA_SIZE * 3), k=DATA_SIZE)
+    data.sort()
+    while True:
+        yield data
+
+
+def test_eytzinger_layout():
+    layout = EytzingerArray([1, 2, 3, 4, 5, 6, 7])
+    assert list(layout.tree[1:]) == [4, 2, 6, 1, 3, 5, 7]
+    assert len(layout) == 7
+
+
+def test_eytzinger_search():
+    data = next(make_data())
+    present = set(data)
+    layout = EytzingerArray(data)
+
+    for target in range(-1, DATA_SIZE * 3 + 1, 31):
+        assert layout.lower_bound(target) == lower_bound(data, target)
+        assert layout.contains(target) == (target in present)
+
+
+def test_eytzinger_small():
+    for size in range(12):
+        data = [value // 2 for value in range(size)]
+        layout = EytzingerArray(data)
+        for target in range(-1, size + 1):
+            assert layout.lower_bound(target) == lower_bound(data, target)
+            assert layout.contains(target) == (target in data)
+
+    words = EytzingerArray(["ant", "bee", "cat"])
+    assert words.contains("bee")
+    assert words.lower_bound("bz") == 2
+
+
+def test_benchmark():
+    results = benchmark(sizes=(1000,), queries=100)
+    assert list(results) == [1000]
@@ -0,0 +1,70 @@
+import pytest
+from random import seed, sample
+from search import lower_bound, jump_search
+from jump_index import JumpIndex
+
+DATA_SIZE = 100000
+
+
+def make_data():
+    seed(0)
+    data = sample(range(DATA_SIZE * 3), k=DATA_SIZE)
+    data.sort()
+    while True:
+        yield data
+
+
+def test_jump_search_segments():
+    # The last values of lyst are past the tenth jump
+    data = list(range(95))
+    for i in range(95):
+        assert jump_search(data, i)
+    assert not jump_search(data, 95)
+    assert not jump_search(data, -1)
+
+
+def test_jump_index():
+    data = next(make_data())
+    present = set(data)
+    index = JumpIndex(data)
+
+    assert index.step == 316
+    assert len(index.fences) == (DATA_SIZE + index.step - 1) // index.step
+    for target in range(-1, DATA_SIZE * 3 + 1, 37):
+        assert index.lower_bound(target) == lower_bound(data, target)
+        assert index.contains(target) == (target in present)
+
+
+def test_jump_index_step():
+    data = [1, 1, 2, 3, 3, 3, 4, 8, 8, 9]
+    for step in range(1, 12):
+        index = JumpIndex(data, step=step)
+        for target in range(11):
+            assert index.lower_bound(target) == lower_bound(data, target)
+
+    with pytest.raises(ValueError):
+        JumpIndex(data, step=0)
+
+
+def test_jump_index_extend():
+    data = list(range(0, 200, 2))
+    index = JumpIndex(data)
+
+    index.extend(range(200, 100000, 2))
+    assert index.step == JumpIndex(list(data)).step
+    for target in range(0, 100001, 7):
+        assert index.lower_bound(target) == lower_bound(data, target)
+
+    fixed = JumpIndex(list(range(10)), step=3)
+    fixed.extend([10, 11, 12, 2 ** 70])
+    assert fixed.step == 3
+    assert list(fixed.fences) == [0, 3, 6, 9, 12]
+    assert fixed.contains(2 ** 70)
+
+    with pytest.raises(ValueError):
+        fixed.extend([5])
+
+    empty = JumpIndex([])
+    assert not empty.contains(1)
+    empty.extend([1, 2, 3])
+    assert empty.contains(2)
@@ -0,0 +1,51 @@
+import pytest
+from random import seed, sample
+from search import lower_bound
+from learned_index import LearnedIndex
+
+DATA_SIZE = 100000
+
+
+def make_data():
+    seed(0)
+    data = sample(range(DATA_SIZE * 3), k=DATA_SIZE)
+    data.sort()
+    while True:
+        yield data
+
+
+def test_learned_index():
+    data = next(make_data())
+    present = set(data)
+    index = LearnedIndex(data, error=16)
+
+    assert index.max_error <= 16
+    for target in range(-1, DATA_SIZE * 3 + 1, 29):
+        assert index.lower_bound(target) == lower_bound(data, target)
+        assert index.contains(target) == (target in present)
+
+
+def test_learned_index_skewed():
+    data = sorted([i * i for i in range(3000)] + [5] * 50 + [2 ** 40, 2 ** 41])
+    index = LearnedIndex(data, error=4)
+
+    assert index.max_error <= 4
+    for target in data + [-1, 6, 7, 2 ** 40 + 1, 2 ** 42]:
+        assert index.lower_bound(target) == lower_bound(data, target)
+
+
+def test_report():
+    data = list(range(0, 3 * DATA_SIZE, 3))
+    report = LearnedIndex(data).report()
+
+    assert report["keys"] == DATA_SIZE
+    assert report["segments"] == 1
+    assert report["max_error"] == 0
+    assert report["model_bytes"] < DATA_SIZE
+
+    empty = LearnedIndex([])
+    assert empty.report()["segments"] == 0
+    assert not empty.contains(1)
+
+    with pytest.raises(ValueError):
+        LearnedIndex(data, error=0)
@@ -0,0 +1,63 @@
+import array
+from random import seed, sample
+import pytest
+import parallel_search
+from parallel_search import parallel_find, SharedScan
+from search import linear_search
+
+DATA_SIZE = 200000
+
+
+def make_data():
+    seed(0)
+    data = sample(range(DATA_SIZE * 3), k=DATA_SIZE)
+    while True:
+        yield data
+
+
+def test_unsorted_linear_search():
+    data = [5, 1, 9, 3]
+    assert not linear_search(data, 3)
+    assert linear_search(data, 3, is_sorted=False)
+    assert not linear_search(data, 4, is_sorted=False)
+
+
+def test_parallel_find(monkeypatch):
+    monkeypatch.setattr(parallel_search, "PARALLEL_THRESHOLD", 0)
+    monkeypatch.setattr(parallel_search, "BLOCK_SIZE", 1000)
+    data = next(make_data())
+
+    for index in (0, 1, DATA_SIZE // 3, DATA_SIZE - 1):
+        assert parallel_find(data, data[index], workers=2) == index
+    assert parallel_find(data, -1, workers=2) == -1
+
+    repeated = [7] * 1000 + [3] * 1000
+    assert parallel_find(repeated, 3, workers=3) == 1000
+    assert parallel_find(repeated, 7, workers=3) == 0
+
+
+def test_serial_fallback():
+    data = next(make_data())
+    assert parallel_find(data, data[-1], workers=1) == DATA_SIZE - 1
+    assert parallel_find(["b", "a"], "a", workers=2) == 1
+    assert parallel_find([], 1) == -1
+
+    numpy = pytest.importorskip("numpy")
+    assert parallel_find(numpy.array(data), data[-1], workers=1) == DATA_SIZE - 1
+    assert parallel_find(numpy.arange(10), 11, workers=1) == -1
+
+
+def test_shared_scan_reuse():
+    data = next(make_data())
+    with SharedScan(array.array("q", data), workers=2) as scan:
+        assert len(scan) == DATA_SIZE
+        # The same block and pool answer every query
+        for index in (DATA_SIZE - 1, 0, DATA_SIZE // 2):
+            assert scan.find(data[index]) == index
+        assert scan.find(-1) == -1
+
+    with SharedScan([4, 2, 4], workers=2) as scan:
+        assert scan.find(4) == 0 and scan.find(2) == 1
+
+    with pytest.raises(TypeError):
+        SharedScan(["a", "b"], workers=2)
@@ -0,0 +1,183 @@
+import pytest
+from array import array
+from random import seed, sample
+from search import lower_bound, upper_bound, contains, index_of, search_many
+from search import interpolation_search, exponential_search, AutoSearch
+from search import _interpolation_bound, _exponential_bound
+from search import count_range, iter_range, range_view, RangeView, Finger
+
+DATA_SIZE = 100000
+
+
+def make_data():
+    seed(0)
+    data = sample(range(DATA_SIZE * 3), k=DATA_SIZE)
+    data.sort()
+    while True:
+        yield data
+
+
+def test_bounds():
+    data = [1, 3, 3, 3, 7, 9]
+
+    assert lower_bound(data, 3) == 1
+    assert upper_bound(data, 3) == 4
+    assert lower_bound(data, 0) == 0
+    assert upper_bound(data, 10) == len(data)
+    assert lower_bound(data, 8) == 5
+    assert lower_bound(data, 3, 2, 4) == 2
+    assert lower_bound([], 5) == 0
+
+
+def test_contains():
+    data = next(make_data())
+    present = set(data)
+
+    for target in range(0, DATA_SIZE * 3, 97):
+        assert contains(data, target) == (target in present)
+
+    assert contains(data, data[0])
+    assert contains(data, data[-1])
+    assert not contains(data, -1)
+    assert not contains([], 1)
+
+
+def test_index_of():
+    data = next(make_data())
+
+    for index in range(0, DATA_SIZE, 1013):
+        assert index_of(data, data[index]) == index
+
+    with pytest.raises(ValueError):
+        index_of(data, DATA_SIZE * 4)
+
+
+def test_search_many():
+    data = next(make_data())
+    present = set(data)
+    targets = [DATA_SIZE * 4, data[-1], -5, data[0], data[500], data[500], 7, 11]
+
+    found = search_many(data, targets)
+    assert found == [target in present for target in targets]
+
+    indices = search_many(data, targets, positions=True)
+    for target, index in zip(targets, indices):
+        if target in present:
+            assert data[index] == target
+        else:
+            assert index == -1
+
+    assert search_many(data, []) == []
+    assert search_many([], [1, 2]) == [False, False]
+
+
+def test_search_many_numpy():
+    numpy = pytest.importorskip("numpy")
+    data = numpy.array([1, 3, 5, 7, 9])
+
+    found = search_many(data, [9, 0, 3, 10])
+    assert found.tolist() == [True, False, True, False]
+
+    indices = search_many(data, [9, 0, 3, 10], positions=True)
+    assert indices.tolist() == [4, -1, 1, -1]
+
+    found = search_many(data, (target for target in [9, 0, 3, 10]))
+    assert found.tolist() == [True, False, True, False]
+
+
+def test_interpolation_and_exponential():
+    data = next(make_data())
+    present = set(data)
+
+    for target in list(range(-3, DATA_SIZE * 3 + 3, 89)) + [data[0], data[-1]]:
+        expected = lower_bound(data, target)
+        assert _interpolation_bound(data, target, 0, len(data)) == expected
+        assert _exponential_bound(data, target, 0, len(data)) == expected
+        assert interpolation_search(data, target) == (target in present)
+        assert exponential_search(data, target) == (target in present)
+
+    duplicates = [1, 2, 2, 2, 2, 2, 9, 9, 10]
+    for target in range(12):
+        expected = lower_bound(duplicates, target)
+        assert _interpolation_bound(duplicates, target, 0, len(duplicates)) == expected
+        assert _exponential_bound(duplicates, target, 0, len(duplicates)) == expected
+
+    assert not interpolation_search([], 3)
+    assert not exponential_search([], 3)
+
+
+def test_interpolation_bad_distribution():
+    data = [2 ** i for i in range(200)]
+
+    for target in data:
+        assert _interpolation_bound(data, target, 0, len(data)) == data.index(target)
+    assert not interpolation_search(data, 3)
+
+
+def test_auto_search():
+    assert AutoSearch(list(range(0, 30000, 3))).strategy == "interpolation"
+    assert AutoSearch([2 ** i for i in range(200)]).strategy == "binary"
+    assert AutoSearch(["a", "b", "c"]).strategy == "binary"
+    assert AutoSearch(list(range(100)), front_biased=True).strategy == "exponential"
+
+    data = next(make_data())
+    present = set(data)
+    for searcher in (AutoSearch(data), AutoSearch(data, front_biased=True)):
+        for target in range(0, DATA_SIZE * 3, 101):
+            assert searcher.contains(target) == (target in present)
+            assert searcher.lower_bound(target) == lower_bound(data, target)
+
+    numpy = pytest.importorskip("numpy")
+    assert AutoSearch(numpy.arange(0, 30000, 3)).strategy == "interpolation"
+
+
+def test_range_queries():
+    data = [1, 3, 3, 5, 7, 7, 7, 9]
+
+    assert count_range(data, 3, 8) == 6
+    assert count_range(data, 0, 100) == len(data)
+    assert count_range(data, 4, 5) == 0
+    assert count_range(data, 8, 2) == 0
+    assert list(iter_range(data, 3, 7)) == [3, 3, 5]
+    assert list(iter_range(data, 10, 20)) == []
+
+    view = range_view(data, 3, 8)
+    assert isinstance(view, RangeView)
+    assert len(view) == 6
+    assert list(view) == [3, 3, 5, 7, 7, 7]
+    assert view[0] == 3 and view[-1] == 7
+    assert list(view[1:3]) == [3, 5]
+    with pytest.raises(IndexError):
+        view[6]
+
+    packed = range_view(array("q", data), 5, 9)
+    assert isinstance(packed, memoryview)
+    assert packed.tolist() == [5, 7, 7, 7]
+
+
+def test_range_view_large():
+    data = next(make_data())
+    low, high = DATA_SIZE, DATA_SIZE * 2
+    expected = [value for value in data if low <= value < high]
+
+    assert count_range(data, low, high) == len(expected)
+    assert list(range_view(data, low, high)) == expected
+
+
+def test_finger():
+    data = next(make_data())
+    present = set(data)
+    finger = Finger(data)
+
+    # Nearly sorted targets, then jumps both ways
+    targets = list(range(0, DATA_SIZE * 3, 13)) + [DATA_SIZE * 3, -1, DATA_SIZE, 5, DATA_SIZE * 2]
+    for target in targets:
+        assert finger.lower_bound(target) == lower_bound(data, target)
+        assert finger.contains(target) == (target in present)
+
+    duplicates = [1, 2, 2, 2, 2, 5, 5, 8]
+    finger = Finger(duplicates, position=6)
+    for target in [2, 5, 0, 9, 5, 2, 1, 8, 3]:
+        assert finger.lower_bound(target) == lower_bound(duplicates, target)
+
+    assert not Finger([]).contains(1)
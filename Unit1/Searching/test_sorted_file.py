@@ -0,0 +1,66 @@
+import pytest
+from random import seed, sample
+from search import binary_search, jump_search, contains, lower_bound
+from sorted_file import write_sorted_file, SortedFile
+
+DATA_SIZE = 200000
+
+
+def make_data():
+    seed(0)
+    data = sample(range(-DATA_SIZE, DATA_SIZE * 2), k=DATA_SIZE)
+    data.sort()
+    while True:
+        yield data
+
+
+def test_round_trip(tmp_path):
+    data = next(make_data())
+    path = str(tmp_path / "data.srt")
+
+    assert write_sorted_file(path, iter(data)) == DATA_SIZE
+    with SortedFile(path) as sorted_file:
+        assert len(sorted_file) == DATA_SIZE
+        assert sorted_file[0] == data[0]
+        assert sorted_file[-1] == data[-1]
+        assert list(sorted_file) == data
+
+
+def test_search_against_file(tmp_path):
+    data = next(make_data())
+    path = str(tmp_path / "data.srt")
+    write_sorted_file(path, data, width=4)
+
+    with SortedFile(path) as sorted_file:
+        for index in (0, DATA_SIZE // 2, DATA_SIZE - 1):
+            assert binary_search(sorted_file, data[index])
+            assert jump_search(sorted_file, data[index])
+            assert lower_bound(sorted_file, data[index]) == index
+        assert not binary_search(sorted_file, DATA_SIZE * 3)
+        assert not jump_search(sorted_file, DATA_SIZE * 3)
+        assert not contains(sorted_file, -DATA_SIZE - 1)
+
+
+def test_empty_file(tmp_path):
+    path = str(tmp_path / "empty.srt")
+    write_sorted_file(path, [])
+
+    with SortedFile(path) as sorted_file:
+        assert len(sorted_file) == 0
+        assert not contains(sorted_file, 0)
+
+
+def test_bad_input(tmp_path):
+    path = str(tmp_path / "bad.srt")
+
+    with pytest.raises(ValueError):
+        write_sorted_file(path, [3, 2, 1])
+    with pytest.raises(ValueError):
+        write_sorted_file(path, [1, 2], width=3)
+    with pytest.raises(OverflowError):
+        write_sorted_file(path, [1, 1000], width=1)
+
+    with open(path, "wb") as file:
+        file.write(b"not a sorted file")
+    with pytest.raises(ValueError):
+        SortedFile(path)
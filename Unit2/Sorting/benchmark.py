@@ -0,0 +1,458 @@
+"""
+benchmark.py
+A benchmark suite for the sorts in sort.py.
+Every algorithm is timed on every input distribution and size:
+  - Each trial sorts a fresh copy of the data
+  - Warm-up runs are thrown away, then the median and 95th percentile
+    of the timed runs are recorded
+  - One extra run counts comparisons, calls to swap() and writes
+    into the list being sorted
+The report is saved as JSON, and can be diffed against a saved baseline.
+
+To run from the command line:
+python benchmark.py --sizes 100 1000 10000 --output report.json
+python benchmark.py --output new.json --baseline report.json
+"""
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import time
+
+import sort
+
+ALGORITHMS = {
+    "selection_sort": sort.selection_sort,
+    "insertion_sort": sort.insertion_sort,
+    "mergesort": sort.mergesort,
+    "buffered_mergesort": sort.buffered_mergesort,
+    "bottom_up_mergesort": sort.bottom_up_mergesort,
+    "quicksort": sort.quicksort,
+    "introsort": sort.introsort,
+    "timsort": sort.timsort,
+    "radix_sort": sort.radix_sort,
+    "counting_sort": sort.counting_sort,
+    "sort": sort.sort,
+}
+
+# The largest size each quadratic sort is run at. quicksort's two-way
+# partition is quadratic on few-unique and organ-pipe input
+SIZE_LIMITS = {
+    "selection_sort": 10 ** 4,
+    "insertion_sort": 10 ** 4,
+    "quicksort": 10 ** 4,
+}
+
+# Counting comparisons wraps every value, so only small sizes are counted
+COUNT_LIMIT = 10 ** 5
+
+DISTRIBUTIONS = ("random", "sorted", "reversed", "few_unique", "organ_pipe", "nearly_sorted")
+SIZES = (10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+
+
+def make_distribution(name, size, seed=0):
+    """
+    Makes a list of integers with the given shape
+
+    Parameters
+    ----------
+    name : str
+        One of DISTRIBUTIONS
+    size : int
+        The number of values
+    seed : int
+        The random seed, so every run sees the same data
+
+    Returns
+    -------
+    (List): The data
+    """
+    generator = random.Random(seed)
+
+    if name == "random":
+        return generator.sample(range(-size * 2, size * 2), size)
+    if name == "sorted":
+        return list(range(size))
+    if name == "reversed":
+        return list(range(size, 0, -1))
+    if name == "few_unique":
+        return [generator.randrange(10) for _ in range(size)]
+    if name == "organ_pipe":
+        return list(range(size // 2)) + list(range(size - size // 2, 0, -1))
+    if name == "nearly_sorted":
+        data = list(range(size))
+        # Swap 1% of the values with a neighbour up to 10 places away
+        for _ in range(max(1, size // 100)):
+            i = generator.randrange(size)
+            j = min(size - 1, i + generator.randrange(1, 11))
+            data[i], data[j] = data[j], data[i]
+        return data
+    raise ValueError(f"unknown distribution {name!r}")
+
+
+class Counted:
+    """
+    Wraps a value and counts every comparison made with it
+    """
+    comparisons = 0
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        """
+        Constructor for Counted
+        """
+        self.value = value
+
+    def __lt__(self, other):
+        """
+        Checks if self is less than other
+        """
+        Counted.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        """
+        Checks if self is less than or equal to other
+        """
+        Counted.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        """
+        Checks if self is greater than other
+        """
+        Counted.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        """
+        Checks if self is greater than or equal to other
+        """
+        Counted.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        """
+        Checks if self is equal to other
+        """
+        Counted.comparisons += 1
+        return self.value == other.value
+
+    __hash__ = None
+
+
+class CountingList(list):
+    """
+    A list that counts the values written into it
+    """
+
+    def __init__(self, *args):
+        """
+        Constructor for CountingList
+        """
+        super().__init__(*args)
+        self.writes = 0
+
+    def __setitem__(self, index, value):
+        """
+        Counts and writes one value, or every value in a slice
+        """
+        if isinstance(index, slice):
+            value = list(value)
+            self.writes += len(value)
+        else:
+            self.writes += 1
+        super().__setitem__(index, value)
+
+
+def count_operations(algorithm, data):
+    """
+    Sorts a copy of data once and counts its work
+
+    Parameters
+    ----------
+    algorithm : Function
+        The sort being counted
+    data : List
+        The data being sorted
+
+    Returns
+    -------
+    (dict): The number of comparisons, swap() calls and writes,
+        or None for each if the sort can't run on wrapped values
+    """
+    swaps = 0
+    original_swap = sort.swap
+
+    def counting_swap(lyst, first, second):
+        """
+        Counts and makes a swap
+        """
+        nonlocal swaps
+        swaps += 1
+        original_swap(lyst, first, second)
+
+    lyst = CountingList(Counted(value) for value in data)
+    Counted.comparisons = 0
+    sort.swap = counting_swap
+    try:
+        algorithm(lyst)
+    except (TypeError, AttributeError, ValueError):
+        # The integer sorts do arithmetic on the values
+        return {"comparisons": None, "swaps": None, "writes": None}
+    finally:
+        sort.swap = original_swap
+
+    return {"comparisons": Counted.comparisons, "swaps": swaps, "writes": lyst.writes}
+
+
+def percentile(times, fraction):
+    """
+    Returns the value below which the given fraction of times fall
+
+    Parameters
+    ----------
+    times : List
+        The measured times
+    fraction : float
+        A fraction between 0 and 1
+
+    Returns
+    -------
+    (float): The percentile
+    """
+    ordered = sorted(times)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def time_algorithm(algorithm, data, repeat=5, warmup=1):
+    """
+    Times a sort on fresh copies of data
+
+    Parameters
+    ----------
+    algorithm : Function
+        The sort being timed
+    data : List
+        The data being sorted. It is never sorted itself
+    repeat : int
+        The number of timed runs
+    warmup : int
+        The number of untimed runs first
+
+    Returns
+    -------
+    (dict): The median, 95th percentile and fastest time, and
+        whether the result was sorted correctly
+    """
+    expected = sorted(data)
+    times = []
+    correct = True
+
+    for trial in range(warmup + repeat):
+        lyst = data[:]
+        start = time.perf_counter()
+        result = algorithm(lyst)
+        elapsed = time.perf_counter() - start
+
+        if trial >= warmup:
+            times.append(elapsed)
+            correct = correct and list(result) == expected
+
+    return {
+        "median": statistics.median(times),
+        "p95": percentile(times, 0.95),
+        "min": min(times),
+        "correct": correct,
+    }
+
+
+def run_suite(algorithms=None, distributions=DISTRIBUTIONS, sizes=SIZES,
+              repeat=5, warmup=1, verbose=True):
+    """
+    Times every algorithm on every distribution at every size
+
+    Parameters
+    ----------
+    algorithms : List
+        The names of the sorts to run. Defaults to all of ALGORITHMS
+    distributions : Iterable
+        The names of the distributions to run
+    sizes : Iterable
+        The sizes to run
+    repeat : int
+        The number of timed runs per case
+    warmup : int
+        The number of untimed runs per case
+    verbose : Boolean
+        Print each result as it finishes?
+
+    Returns
+    -------
+    (dict): The report, with the settings under "meta" and
+        one entry per case under "results"
+    """
+    algorithms = algorithms or list(ALGORITHMS)
+    results = []
+
+    for size in sizes:
+        for distribution in distributions:
+            data = make_distribution(distribution, size)
+
+            for name in algorithms:
+                if size > SIZE_LIMITS.get(name, size):
+                    continue
+
+                entry = {"algorithm": name, "distribution": distribution, "size": size}
+                try:
+                    entry.update(time_algorithm(ALGORITHMS[name], data, repeat, warmup))
+                    if size <= COUNT_LIMIT:
+                        entry.update(count_operations(ALGORITHMS[name], data))
+                except (RecursionError, ValueError) as error:
+                    entry["error"] = type(error).__name__
+
+                results.append(entry)
+                if verbose:
+                    print(_format_entry(entry))
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "repeat": repeat,
+            "warmup": warmup,
+        },
+        "results": results,
+    }
+
+
+def _format_entry(entry):
+    """
+    Returns one line describing a result
+    """
+    case = f"{entry['algorithm']:<20} {entry['distribution']:<14} {entry['size']:>10}"
+    if "error" in entry:
+        return f"{case}  {entry['error']}"
+    return f"{case}  median {entry['median']:.6f}s  p95 {entry['p95']:.6f}s"
+
+
+def save_report(report, path):
+    """
+    Saves a report as JSON
+
+    Parameters
+    ----------
+    report : dict
+        The report from run_suite()
+    path : str
+        The file to write
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+
+
+def load_report(path):
+    """
+    Loads a report saved by save_report()
+
+    Parameters
+    ----------
+    path : str
+        The file to read
+
+    Returns
+    -------
+    (dict): The report
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def diff_reports(baseline, current, threshold=0.10):
+    """
+    Compares the median times of two reports, case by case
+
+    Parameters
+    ----------
+    baseline : dict
+        The report being compared against
+    current : dict
+        The new report
+    threshold : float
+        How much a median may change before it counts as a
+        regression or an improvement
+
+    Returns
+    -------
+    (List): One dict per case in both reports, with the old and new
+        medians, their ratio and a status of "regression",
+        "improvement" or "same"
+    """
+    def key(entry):
+        """
+        Returns the case an entry is for
+        """
+        return entry["algorithm"], entry["distribution"], entry["size"]
+
+    old = {key(entry): entry for entry in baseline["results"] if "median" in entry}
+    changes = []
+    for entry in current["results"]:
+        if "median" not in entry or key(entry) not in old:
+            continue
+
+        before = old[key(entry)]["median"]
+        ratio = entry["median"] / before if before else math.inf
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 - threshold:
+            status = "improvement"
+        else:
+            status = "same"
+
+        changes.append({
+            "algorithm": entry["algorithm"],
+            "distribution": entry["distribution"],
+            "size": entry["size"],
+            "baseline": before,
+            "current": entry["median"],
+            "ratio": ratio,
+            "status": status,
+        })
+    return changes
+
+
+def main():
+    """
+    The main function for benchmark.py.
+    Runs the suite with the command line's settings, saves the
+    report and prints a diff if a baseline was given.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the sorts in sort.py")
+    parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS))
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS,
+                        default=list(DISTRIBUTIONS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument("--baseline", help="A saved report to diff against")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args()
+
+    report = run_suite(args.algorithms, args.distributions, args.sizes,
+                       args.repeat, args.warmup)
+    save_report(report, args.output)
+
+    if args.baseline:
+        for change in diff_reports(load_report(args.baseline), report, args.threshold):
+            if change["status"] != "same":
+                print(f"{change['status']:<12} {change['algorithm']:<20} "
+                      f"{change['distribution']:<14} {change['size']:>10}  "
+                      f"{change['ratio']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""
+external_sort.py
+Contains an external (out-of-core) sort for files of integers too big to
+sort in memory:
+  1. The input is read in chunks that fit in the memory budget
+  2. Each chunk is sorted with one of the sorts in sort.py
+  3. Each sorted chunk (a run) is spilled to a temporary binary file
+  4. The runs are merged with a heap-based k-way merge, using buffered
+     reads, in as many passes as the memory budget needs
+"""
+import array
+import heapq
+import os
+import tempfile
+import time
+
+from sort import timsort
+
+# The rough cost in memory of one integer in a Python list:
+# the list's pointer plus the int object
+BYTES_PER_VALUE = 40
+
+# The smallest read buffer a run gets during a merge
+MIN_BUFFER_BYTES = 64 * 1024
+
+# The most runs merged at once. Each one holds an open file, and many
+# systems allow a process only 1024 of them
+MAX_FAN_IN = 256
+
+# Runs and output files hold 8 byte integers
+TYPECODE = "q"
+ITEM_SIZE = array.array(TYPECODE).itemsize
+
+
+def _read_chunks(path, chunk_length, binary, stats):
+    """
+    Used in external_sort().
+    Reads a file of integers a chunk at a time.
+
+    Parameters
+    ----------
+    path : str
+        The file being read
+    chunk_length : int
+        The largest number of integers in a chunk
+    binary : Boolean
+        Does the file hold raw 8 byte integers? If not, it holds one
+        integer per line of text
+    stats : dict
+        Counts bytes_read
+
+    Yields
+    ------
+    (List): The next chunk of integers
+    """
+    if binary:
+        with open(path, "rb") as file:
+            while True:
+                chunk = array.array(TYPECODE)
+                try:
+                    chunk.fromfile(file, chunk_length)
+                except EOFError:
+                    pass  # The last chunk is short; fromfile keeps what it read
+                stats["bytes_read"] += len(chunk) * ITEM_SIZE
+                if not chunk:
+                    return
+                yield chunk.tolist()
+    else:
+        with open(path, "r", encoding="utf-8") as file:
+            chunk = []
+            for line in file:
+                stats["bytes_read"] += len(line)
+                if line.strip():
+                    chunk.append(int(line))
+                if len(chunk) == chunk_length:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+
+
+def _read_run(path, buffer_length, stats):
+    """
+    Used in _merge_runs().
+    Reads a run file back in buffers of buffer_length integers.
+
+    Parameters
+    ----------
+    path : str
+        The run file
+    buffer_length : int
+        The number of integers read at a time
+    stats : dict
+        Counts bytes_read
+
+    Yields
+    ------
+    (int): The integers in the run, in order
+    """
+    with open(path, "rb") as file:
+        while True:
+            buffer = array.array(TYPECODE)
+            try:
+                buffer.fromfile(file, buffer_length)
+            except EOFError:
+                pass  # The last buffer is short
+            stats["bytes_read"] += len(buffer) * ITEM_SIZE
+            if not buffer:
+                return
+            yield from buffer
+
+
+def _write_values(values, file, buffer_length, binary, stats):
+    """
+    Used in external_sort() and _merge_runs().
+    Writes integers to a file in buffers of buffer_length integers.
+
+    Parameters
+    ----------
+    values : Iterable
+        The integers to write
+    file : File
+        The open file being written
+    buffer_length : int
+        The number of integers written at a time
+    binary : Boolean
+        Write raw 8 byte integers? If not, write one integer per line of text
+    stats : dict
+        Counts bytes_written
+    """
+    buffer = array.array(TYPECODE)
+    for value in values:
+        buffer.append(value)
+        if len(buffer) == buffer_length:
+            stats["bytes_written"] += _flush(buffer, file, binary)
+            buffer = array.array(TYPECODE)
+    stats["bytes_written"] += _flush(buffer, file, binary)
+
+
+def _flush(buffer, file, binary):
+    """
+    Used in _write_values().
+    Writes a buffer of integers to a file.
+
+    Parameters
+    ----------
+    buffer : array
+        The integers to write
+    file : File
+        The open file being written
+    binary : Boolean
+        Write raw 8 byte integers? If not, write one integer per line of text
+
+    Returns
+    -------
+    (int): The number of bytes written
+    """
+    if binary:
+        buffer.tofile(file)
+        return len(buffer) * ITEM_SIZE
+    text = "".join(f"{value}\n" for value in buffer)
+    file.write(text)
+    return len(text)
+
+
+def _merge_runs(paths, output, buffer_length, binary, stats):
+    """
+    Used in external_sort().
+    Merges sorted run files with a heap-based k-way merge.
+
+    Parameters
+    ----------
+    paths : List
+        The run files being merged
+    output : File
+        The open file the merged run is written to
+    buffer_length : int
+        The number of integers each run reads (and the output writes) at a time
+    binary : Boolean
+        Write raw 8 byte integers? If not, write one integer per line of text
+    stats : dict
+        Counts bytes_read and bytes_written
+    """
+    runs = [_read_run(path, buffer_length, stats) for path in paths]
+    _write_values(heapq.merge(*runs), output, buffer_length, binary, stats)
+
+
+def external_sort(input_path, output_path, memory_budget=64 * 1024 * 1024,
+                  binary=False, algorithm=timsort, temp_dir=None):
+    """
+    Sorts a file of integers while keeping about memory_budget bytes of
+    values in memory at once.
+
+    Parameters
+    ----------
+    input_path : str
+        The file being sorted
+    output_path : str
+        The file the sorted integers are written to
+    memory_budget : int
+        The number of bytes of values to hold in memory at once
+    binary : Boolean
+        Do the files hold raw 8 byte integers? If not, they hold
+        one integer per line of text
+    algorithm : Function
+        The sort from sort.py used on each chunk
+    temp_dir : str
+        Where the run files go. Defaults to the system temp directory
+
+    Returns
+    -------
+    (dict): The number of values, runs and merge passes, the bytes
+        read and written, the seconds taken and the I/O throughput
+    """
+    start = time.perf_counter()
+    stats = {"values": 0, "runs": 0, "merge_passes": 0, "bytes_read": 0, "bytes_written": 0}
+
+    chunk_length = max(1, memory_budget // BYTES_PER_VALUE)
+    # Each run being merged gets a read buffer, and so does the output
+    fan_in = min(MAX_FAN_IN, max(2, memory_budget // MIN_BUFFER_BYTES - 1))
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as run_dir:
+        # Sort chunks that fit in memory and spill each as a run
+        runs = []
+        for chunk in _read_chunks(input_path, chunk_length, binary, stats):
+            chunk = algorithm(chunk)
+            path = os.path.join(run_dir, f"run{len(runs)}.bin")
+            with open(path, "wb") as run_file:
+                _write_values(chunk, run_file, MIN_BUFFER_BYTES // ITEM_SIZE, True, stats)
+            runs.append(path)
+            stats["values"] += len(chunk)
+        stats["runs"] = len(runs)
+
+        # Merge groups of fan_in runs until one merge can finish the job
+        while len(runs) > fan_in:
+            stats["merge_passes"] += 1
+            buffer_length = max(1, memory_budget // (fan_in + 1) // BYTES_PER_VALUE)
+            merged = []
+            for i in range(0, len(runs), fan_in):
+                path = os.path.join(run_dir, f"pass{stats['merge_passes']}_{len(merged)}.bin")
+                with open(path, "wb") as run_file:
+                    _merge_runs(runs[i:i + fan_in], run_file, buffer_length, True, stats)
+                for old_path in runs[i:i + fan_in]:
+                    os.remove(old_path)
+                merged.append(path)
+            runs = merged
+
+        # The final merge writes the output file
+        if runs:
+            stats["merge_passes"] += 1
+        buffer_length = max(1, memory_budget // (len(runs) + 1) // BYTES_PER_VALUE)
+        mode = "wb" if binary else "w"
+        encoding = None if binary else "utf-8"
+        with open(output_path, mode, encoding=encoding) as output:
+            _merge_runs(runs, output, buffer_length, binary, stats)
+
+    stats["seconds"] = time.perf_counter() - start
+    total_bytes = stats["bytes_read"] + stats["bytes_written"]
+    stats["throughput_mb_s"] = total_bytes / 1e6 / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
@@ -0,0 +1,211 @@
+"""
+numpy_backend.py
+Contains NumPy versions of the sorts in sort.py. Each one sorts a
+numpy.ndarray in place with array operations instead of Python loops,
+and never converts the array to a list.
+The functions in sort.py call these automatically when given an ndarray.
+"""
+import numpy
+
+# Sub-arrays this short are sorted as one block
+BLOCK_SIZE = 32
+
+
+def selection_sort(values):
+    """
+    Selection sorts an array in place. Each pass finds the smallest
+    remaining value with one argmin over the unsorted part.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The array to be sorted
+
+    Returns
+    -------
+    (numpy.ndarray): values, sorted
+    """
+    for i in range(len(values) - 1):
+        smallest = i + int(numpy.argmin(values[i:]))
+        values[i], values[smallest] = values[smallest], values[i]
+    return values
+
+
+def insertion_sort(values):
+    """
+    Insertion sorts an array in place. Each value's place is found with
+    searchsorted, and the values after it are shifted up as one block.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The array to be sorted
+
+    Returns
+    -------
+    (numpy.ndarray): values, sorted
+    """
+    for i in range(1, len(values)):
+        value = values[i]
+        index = int(numpy.searchsorted(values[:i], value, side="right"))
+        if index < i:
+            values[index + 1:i + 1] = values[index:i].copy()
+            values[index] = value
+    return values
+
+
+def _merge(source, target, left, mid, right):
+    """
+    Used in mergesort().
+    Merges the sorted runs source[left:mid] and source[mid:right] into
+    target[left:right]. Every value's final place is its place in its own
+    run plus the number of values before it in the other run, so the
+    merge is two searchsorted calls and two scatters. Equal values keep
+    their order.
+
+    Parameters
+    ----------
+    source : numpy.ndarray
+        The array holding the two runs
+    target : numpy.ndarray
+        The array the merged run is written to
+    left : int
+        The first index of the first run
+    mid : int
+        The first index of the second run
+    right : int
+        One past the last index of the second run
+    """
+    first = source[left:mid]
+    second = source[mid:right]
+    output = target[left:right]
+
+    output[numpy.arange(len(first)) + numpy.searchsorted(second, first, side="left")] = first
+    output[numpy.arange(len(second)) + numpy.searchsorted(first, second, side="right")] = second
+
+
+def mergesort(values):
+    """
+    Merge sorts an array in place, bottom up. Blocks of BLOCK_SIZE values
+    are sorted together as the rows of a 2D view, then merged in passes
+    of doubling width between the array and one buffer.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The array to be sorted
+
+    Returns
+    -------
+    (numpy.ndarray): values, sorted
+    """
+    length = len(values)
+    whole_blocks = length - length % BLOCK_SIZE
+    values[:whole_blocks].reshape(-1, BLOCK_SIZE).sort(axis=1, kind="stable")
+    values[whole_blocks:].sort(kind="stable")
+
+    source = values
+    target = numpy.empty_like(values)
+    width = BLOCK_SIZE
+    while width < length:
+        for left in range(0, length, 2 * width):
+            mid = min(left + width, length)
+            right = min(left + 2 * width, length)
+            _merge(source, target, left, mid, right)
+        source, target = target, source
+        width *= 2
+
+    if source is not values:
+        values[...] = source
+    return values
+
+
+def quicksort(values):
+    """
+    Quick sorts an array in place. Each partition is split into the
+    values less than, equal to and greater than a median of three pivot
+    with boolean masks. Partitions of BLOCK_SIZE values or fewer are
+    sorted as one block. NaNs compare false to everything, so they are
+    never picked as the pivot and go after every number, as they do
+    with numpy.sort().
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The array to be sorted
+
+    Returns
+    -------
+    (numpy.ndarray): values, sorted
+    """
+    stack = [(0, len(values))]
+    while stack:
+        left, right = stack.pop()
+        part = values[left:right]
+
+        if right - left <= BLOCK_SIZE:
+            part.sort()
+            continue
+
+        pivot = _pivot(part)
+        if pivot is None:
+            continue  # Every value is NaN
+        lesser = part[part < pivot]
+        greater = part[part > pivot]
+        equal_count = int(numpy.count_nonzero(part == pivot))
+        # Whatever is left is NaN
+        nan_count = len(part) - len(lesser) - len(greater) - equal_count
+
+        # Write the groups back over the partition, NaNs last
+        part[:len(lesser)] = lesser
+        part[len(lesser):len(lesser) + equal_count] = pivot
+        part[len(lesser) + equal_count:len(part) - nan_count] = greater
+        if nan_count:
+            part[len(part) - nan_count:] = numpy.nan
+
+        stack.append((left, left + len(lesser)))
+        stack.append((right - nan_count - len(greater), right - nan_count))
+    return values
+
+
+def _pivot(part):
+    """
+    Used in quicksort().
+    Picks the median of the first, middle and last values that aren't NaN.
+
+    Parameters
+    ----------
+    part : numpy.ndarray
+        The partition being split
+
+    Returns
+    -------
+    (Object): The pivot, or None if every value is NaN
+    """
+    candidates = [part[0], part[len(part) // 2], part[-1]]
+    if not numpy.issubdtype(part.dtype, numpy.inexact):
+        # Only floats can hold NaNs, and isnan() rejects strings
+        return sorted(candidates)[1]
+    candidates = [value for value in candidates if not numpy.isnan(value)]
+    if not candidates:
+        numbers = part[~numpy.isnan(part)]
+        if not numbers.size:
+            return None
+        candidates = [numbers[len(numbers) // 2]]
+    return sorted(candidates)[len(candidates) // 2]
+
+
+def timsort(values):
+    """
+    Returns a sorted copy of an array, like sorted() does for a list
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The array to be sorted
+
+    Returns
+    -------
+    (numpy.ndarray): A sorted copy of values
+    """
+    return numpy.sort(values, kind="stable")
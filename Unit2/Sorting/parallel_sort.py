@@ -0,0 +1,218 @@
+"""
+parallel_sort.py
+Contains a merge sort that runs across every core.
+The data is copied once into shared memory, split into one chunk per
+worker, and the chunks are sorted in worker processes. The sorted runs
+are then merged in pairs, in parallel, between two shared memory blocks
+until one run is left.
+"""
+import array
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from sort import make_data, mergesort, time_sorts, timsort
+
+# Lists shorter than this are sorted in this process; a pool costs more
+PARALLEL_THRESHOLD = 100_000
+
+
+def _shared_values(lyst):
+    """
+    Used in parallel_sort().
+    Packs lyst into an array that can be copied into shared memory.
+    Only plain ints and plain floats are packed: bools and other
+    subclasses would come back as plain ints or floats.
+
+    Parameters
+    ----------
+    lyst : List
+        The values being sorted
+
+    Returns
+    -------
+    (array | None): The values as 8 byte integers ("q") or floats ("d"),
+        or None if they can't go in shared memory
+    """
+    types = set(map(type, lyst))
+    try:
+        if types == {int}:
+            return array.array("q", lyst)
+        if types == {float}:
+            return array.array("d", lyst)
+    except OverflowError:
+        pass  # An int too big for 8 bytes
+    return None
+
+
+def _sort_run(name, typecode, start, stop):
+    """
+    Used in parallel_sort(). Runs in a worker process.
+    Sorts values[start:stop] of a shared memory block in place.
+
+    Parameters
+    ----------
+    name : str
+        The name of the shared memory block
+    typecode : str
+        The array type code of the values
+    start : int
+        The first index of the run
+    stop : int
+        One past the last index of the run
+    """
+    memory = shared_memory.SharedMemory(name=name)
+    values = memory.buf.cast(typecode)
+    try:
+        run = values[start:stop].tolist()
+        run.sort()
+        values[start:stop] = array.array(typecode, run)
+    finally:
+        values.release()
+        memory.close()
+
+
+def _merge_runs(source_name, target_name, typecode, left, mid, right):
+    """
+    Used in parallel_sort(). Runs in a worker process.
+    Merges the sorted runs source[left:mid] and source[mid:right]
+    into target[left:right].
+
+    Parameters
+    ----------
+    source_name : str
+        The name of the shared memory block holding the runs
+    target_name : str
+        The name of the shared memory block the merged run goes in
+    typecode : str
+        The array type code of the values
+    left : int
+        The first index of the first run
+    mid : int
+        The first index of the second run
+    right : int
+        One past the last index of the second run
+    """
+    source_memory = shared_memory.SharedMemory(name=source_name)
+    target_memory = shared_memory.SharedMemory(name=target_name)
+    source = source_memory.buf.cast(typecode)
+    target = target_memory.buf.cast(typecode)
+    try:
+        if mid == right or not source[mid] < source[mid - 1]:
+            # The runs are already in order, so they are copied as they are
+            target[left:right] = source[left:right]
+        else:
+            # Timsort finds the two runs and does one galloping merge of
+            # them in C. heapq.merge() over the two slices was three
+            # times slower
+            merged = source[left:mid].tolist()
+            merged += source[mid:right].tolist()
+            merged.sort()
+            target[left:right] = array.array(typecode, merged)
+    finally:
+        source.release()
+        target.release()
+        source_memory.close()
+        target_memory.close()
+
+
+def parallel_sort(lyst, workers=None):
+    """
+    Sorts a list of numbers across a pool of worker processes.
+    This function mutates lyst
+
+    Parameters
+    ----------
+    lyst : List
+        The list to be sorted. Lists that aren't all 8 byte ints
+        or all floats are sorted in this process instead
+    workers : int
+        The number of worker processes. Defaults to the number of cores
+
+    Returns
+    -------
+    (List): lyst, sorted
+    """
+    workers = workers or os.cpu_count() or 1
+    length = len(lyst)
+    data = None
+    if workers > 1 and length > 1 and length >= PARALLEL_THRESHOLD:
+        data = _shared_values(lyst)
+    if data is None:
+        lyst.sort()
+        return lyst
+
+    typecode = data.typecode
+    size = data.itemsize * length
+    source = shared_memory.SharedMemory(create=True, size=size)
+    target = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        values = source.buf.cast(typecode)
+        values[:] = data
+        values.release()
+        del data
+
+        # One run per worker
+        chunk_size = -(-length // workers)
+        runs = [(start, min(start + chunk_size, length))
+                for start in range(0, length, chunk_size)]
+
+        with ProcessPoolExecutor(workers) as executor:
+            futures = [executor.submit(_sort_run, source.name, typecode, start, stop)
+                       for start, stop in runs]
+            for future in futures:
+                future.result()
+
+            # Merge neighbouring runs in pairs until one run is left
+            while len(runs) > 1:
+                merged_runs = []
+                futures = []
+                for i in range(0, len(runs), 2):
+                    left, mid = runs[i]
+                    right = runs[i + 1][1] if i + 1 < len(runs) else mid
+                    futures.append(executor.submit(_merge_runs, source.name, target.name,
+                                                   typecode, left, mid, right))
+                    merged_runs.append((left, right))
+                for future in futures:
+                    future.result()
+
+                runs = merged_runs
+                source, target = target, source
+
+        values = source.buf.cast(typecode)
+        lyst[:] = values.tolist()
+        values.release()
+        return lyst
+    finally:
+        for memory in (source, target):
+            memory.close()
+            memory.unlink()
+
+
+def speedup(size=10_000_000, workers=None):
+    """
+    Times parallel_sort() against mergesort() and timsort() on
+    copies of the same data, and prints the speedup over each.
+
+    Parameters
+    ----------
+    size : int
+        The size of the dataset
+    workers : int
+        The number of worker processes. Defaults to the number of cores
+
+    Returns
+    -------
+    (dict): The seconds taken by each sort
+    """
+    data = next(make_data(size))
+    times = time_sorts(data, (("mergesort", mergesort), ("timsort", timsort),
+                              ("parallel_sort", lambda lyst: parallel_sort(lyst, workers))))
+
+    for name in ("mergesort", "timsort"):
+        print(f"parallel_sort speedup over {name}: {times[name] / times['parallel_sort']:.2f}x")
+    return times
+
+
+if __name__ == "__main__":
+    speedup()
@@ -1,15 +1,62 @@
 """
 This module contains four sorting algorithms:
   - Selection Sort
-  - Insertion Sort
-  - Merge Sort
-  - Quick sort
+  - Insertion Sort (Plus a binary insertion version)
+  - Merge Sort (Plus buffered top-down, bottom-up and natural run versions)
+  - Quick sort (Plus an introsort-hardened version)
+It also contains two sorts for integers in a bounded range:
+  - LSD Radix Sort
+  - Counting Sort
+Both use NumPy when it is installed and given a NumPy array.
+Given a NumPy array, the other sorts hand off to the vectorized
+versions in numpy_backend.py.
+For when only part of the order is needed, there is selection:
+  - nth_element() and quickselect(), built on quick sort's partition
+  - partial_sort() and top_k()
+  - sorted_iter(), which yields the smallest values first, lazily
+sort() profiles its input with analyze() and picks the cheapest of these
+(or NumPy's own sort) for it. sort(key=...) and argsort() compute each
+value's key only once.
 There is also a timing method as well as testing for python's timsort function.
 """
 
+import array
+import bisect
+import functools
+import heapq
+import math
+import operator
 import time
 import random
 import statistics
+from itertools import chain, islice, repeat
+
+try:
+    import numpy
+    import numpy_backend
+except ImportError:  # NumPy is optional; NumPy arrays are sorted with it if present
+    numpy = None
+    numpy_backend = None
+
+# Sub-lists this short are finished with binary insertion sort.
+# Shared by the merge sorts and introsort; tune it here
+INSERTION_THRESHOLD = 24
+
+# Runs shorter than this (and at least half of it) are extended with insertion sort
+MIN_RUN = 32
+
+# A merge switches to galloping after this many values in a row come from one run
+MIN_GALLOP = 7
+
+# The widest range of values counting_sort() will allocate counts for
+COUNTING_RANGE_LIMIT = 1 << 24
+
+# Sub-lists this long pick their pivot with a ninther instead of a median of three
+NINTHER_THRESHOLD = 128
+
+# The number of evenly spaced values analyze() samples to estimate
+# inversions and duplicates
+SAMPLE_SIZE = 256
 
 
 def swap(lyst, first, second):
@@ -45,12 +92,8 @@ def is_sorted(lyst):
     Returns:
     (Boolean): Is the list sorted?
     """
-    last_value = lyst[0]
-    for i in lyst[1:]:
-        # If the current value is greater than the previous
-        if i < last_value:
-            return False
-    return True
+    # Pairs each value with the one after it, without copying the list
+    return not any(map(operator.lt, islice(lyst, 1, None), lyst))
 
 
 def time_it(func):
@@ -82,6 +125,64 @@ def time_it(func):
     return wrap
 
 
+def time_sorts(data, sorts):
+    """
+    Times each sort on its own copy of data, and prints each time.
+
+    Parameters:
+    -----------
+    data : List
+        The data being sorted. It is never sorted itself
+    sorts : Iterable
+        (name, Function) pairs, one for each sort
+
+    Returns:
+    --------
+    (dict): The seconds taken by each sort, by name
+    """
+    times = {}
+    for name, func in sorts:
+        test = data.copy()
+        start = time.perf_counter()
+        func(test)
+        times[name] = time.perf_counter() - start
+        print(f"{name} duration: {times[name]} seconds.")
+    return times
+
+
+def numpy_dispatch(backend_name):
+    """
+    A decorator that sends numpy.ndarray input to the vectorized sort
+    in numpy_backend.py, and everything else to the decorated sort.
+
+    Parameters:
+    -----------
+    backend_name : str
+        The name of the sort in numpy_backend.py
+
+    Returns:
+    --------
+    decorator : Function
+        The function that wraps a sort
+    """
+    def decorator(func):
+        """
+        Wraps func
+        """
+        @functools.wraps(func)
+        def wrap(lyst, *args, **kwargs):
+            """
+            Calls the NumPy sort for arrays, or func for anything else
+            """
+            if numpy is not None and isinstance(lyst, numpy.ndarray):
+                return getattr(numpy_backend, backend_name)(lyst)
+            return func(lyst, *args, **kwargs)
+
+        return wrap
+
+    return decorator
+
+
 def make_data(size):
     """
     Makes a global data set
@@ -96,13 +197,15 @@ def make_data(size):
     Yields:
     -------
     data : List
-        The dataset
+        A fresh copy of the dataset, so an in-place sort
+        can't hand sorted data to the next one
     """
     data = random.sample(range(-size * 2, size * 2), size)
     while True:
-        yield data
+        yield data[:]
 
 
+@numpy_dispatch("selection_sort")
 def selection_sort(lyst):
     """
     Runs the selection sort algorithm
@@ -130,6 +233,7 @@ def selection_sort(lyst):
     return lyst
 
 
+@numpy_dispatch("insertion_sort")
 def insertion_sort(lyst):
     """
     Runs the insertion sorting algorithm on a list. Rather than
@@ -144,13 +248,14 @@ def insertion_sort(lyst):
     -------
     (List): The sorted list
     """
+    last_index = len(lyst) - 1
     for i in range(len(lyst) - 2, -1, -1):
         current_value = lyst[i]
         current_index = i
 
         # While i pointer is less than the length of the list
         # and the next value is less than the current
-        while current_index < len(lyst) - 1 and lyst[current_index + 1] < current_value:
+        while current_index < last_index and lyst[current_index + 1] < current_value:
             # Shift the list down
             lyst[current_index] = lyst[current_index + 1]
             current_index += 1
@@ -159,6 +264,7 @@ def insertion_sort(lyst):
     return lyst
 
 
+@numpy_dispatch("mergesort")
 def mergesort(lyst):
     """
     Recursive helper function for _merge_sort()
@@ -251,6 +357,453 @@ def _merge(list_a, list_b):
     return merged
 
 
+@numpy_dispatch("insertion_sort")
+def binary_insertion_sort(lyst):
+    """
+    Runs the insertion sorting algorithm on a list, finding each value's
+    place with a binary search and shifting the values after it with a
+    single slice assignment instead of one at a time.
+    This function mutates lyst
+
+    Parameters
+    ----------
+    lyst : List
+        The list to be sorted
+
+    Returns
+    -------
+    (List): lyst, sorted
+    """
+    _binary_insertion_sort(lyst, 0, len(lyst) - 1)
+    return lyst
+
+
+def _binary_insertion_sort(lyst, left, right, start=None):
+    """
+    Binary insertion sorts the sub-list lyst[left:right + 1] in place.
+    This is the small sub-list kernel shared by the faster sorts: they
+    hand it any sub-list of INSERTION_THRESHOLD values or fewer.
+
+    Parameters
+    ----------
+    lyst : List
+        The list being sorted
+    left : Int
+        The pointer for the left-most value
+    right : Int
+        The pointer for the right-most value
+    start : Int
+        The pointer for the first value that may be out of place.
+        lyst[left:start] must already be sorted. Defaults to left + 1
+    """
+    if start is None:
+        start = left + 1
+
+    for i in range(start, right + 1):
+        current_value = lyst[i]
+        # Place current_value after any equal values, so the sort is stable
+        index = bisect.bisect_right(lyst, current_value, left, i)
+        if index < i:
+            # Shift the larger values up as one block
+            lyst[index + 1:i + 1] = lyst[index:i]
+            lyst[index] = current_value
+
+
+@numpy_dispatch("mergesort")
+def buffered_mergesort(lyst):
+    """
+    Sorts lyst with a top-down merge sort that allocates exactly one
+    auxiliary list. Each level merges from one list into the other,
+    swapping their roles on the way down, so nothing is copied back.
+    Short sub-lists are insertion sorted.
+    This function mutates lyst
+
+    Parameters
+    ----------
+    lyst : List
+        The list being sorted
+
+    Returns
+    -------
+    (List): lyst, sorted
+    """
+    buffer = lyst[:]  # The single auxiliary list
+    _buffered_merge_sort(buffer, lyst, 0, len(lyst))
+    return lyst
+
+
+def _buffered_merge_sort(source, target, left, right):
+    """
+    Used in buffered_mergesort().
+    Sorts source[left:right] into target[left:right]. Both lists
+    must hold the same values in that range when called; source
+    is left holding the sub-list in a scrambled order.
+
+    Parameters
+    ----------
+    source : List
+        The list being sorted from
+    target : List
+        The list the sorted values end up in
+    left : Int
+        The first index of the sub-list
+    right : Int
+        One past the last index of the sub-list
+    """
+    if right - left <= INSERTION_THRESHOLD:
+        _binary_insertion_sort(target, left, right - 1)
+        return
+
+    mid = (left + right) // 2
+
+    # Sort each half into source, then merge the halves into target
+    _buffered_merge_sort(target, source, left, mid)
+    _buffered_merge_sort(target, source, mid, right)
+    _merge_into(source, target, left, mid, right)
+
+
+def _merge_into(source, target, left, mid, right):
+    """
+    Used in the buffered merge sorts.
+    Merges the sorted runs source[left:mid] and source[mid:right]
+    into target[left:right]. Equal values keep their order.
+
+    Parameters
+    ----------
+    source : List
+        The list holding the two runs
+    target : List
+        The list the merged run is written to
+    left : Int
+        The first index of the first run
+    mid : Int
+        The first index of the second run
+    right : Int
+        One past the last index of the second run
+    """
+    i = left
+    j = mid
+    k = left
+
+    while i < mid and j < right:
+        if source[j] < source[i]:
+            target[k] = source[j]
+            j += 1
+        else:
+            target[k] = source[i]
+            i += 1
+        k += 1
+
+    # Only one run has values left; copy them across in one step
+    if i < mid:
+        target[k:right] = source[i:mid]
+    else:
+        target[k:right] = source[j:right]
+
+
+@numpy_dispatch("mergesort")
+def bottom_up_mergesort(lyst):
+    """
+    Sorts lyst with an iterative (bottom-up) merge sort that allocates
+    exactly one auxiliary list. Runs of INSERTION_THRESHOLD values are
+    insertion sorted, then merged in passes of doubling width, each pass
+    going from one list into the other.
+    This function mutates lyst
+
+    Parameters
+    ----------
+    lyst : List
+        The list being sorted
+
+    Returns
+    -------
+    (List): lyst, sorted
+    """
+    length = len(lyst)
+    for left in range(0, length, INSERTION_THRESHOLD):
+        _binary_insertion_sort(lyst, left, min(left + INSERTION_THRESHOLD, length) - 1)
+
+    source = lyst
+    target = [None] * length  # The single auxiliary list
+    width = INSERTION_THRESHOLD
+    while width < length:
+        for left in range(0, length, 2 * width):
+            mid = min(left + width, length)
+            right = min(left + 2 * width, length)
+            _merge_into(source, target, left, mid, right)
+        source, target = target, source
+        width *= 2
+
+    # The last pass may have left the sorted values in the auxiliary list
+    if source is not lyst:
+        lyst[:] = source
+    return lyst
+
+
+@numpy_dispatch("mergesort")
+def natural_mergesort(lyst):
+    """
+    An adaptive merge sort that takes advantage of order already in lyst:
+      - The list is split into the ascending and descending runs it
+        already has; descending runs are reversed
+      - Runs shorter than MIN_RUN are extended with insertion sort
+      - Runs are kept on a stack and merged when their lengths break
+        timsort's rules, which keeps merges balanced
+      - Merges skip the values already in place, and switch to galloping
+        (copying whole blocks found by binary search) when one run keeps
+        winning
+    Already sorted (or reversed) input is one run and sorts in O(n).
+    This function mutates lyst
+
+    Parameters
+    ----------
+    lyst : List
+        The list being sorted
+
+    Returns
+    -------
+    (List): lyst, sorted
+    """
+    length = len(lyst)
+    min_run = _min_run_length(length)
+    runs = []  # The stack of [start, length] runs waiting to be merged
+
+    start = 0
+    while start < length:
+        end = _find_run(lyst, start, length)
+
+        # Extend a short run to min_run values
+        if end - start < min_run:
+            forced_end = min(start + min_run, length)
+            _binary_insertion_sort(lyst, start, forced_end - 1, end)
+            end = forced_end
+
+        runs.append([start, end - start])
+        _collapse_runs(lyst, runs)
+        start = end
+
+    # Merge whatever is left on the stack, newest first
+    while len(runs) > 1:
+        _merge_at(lyst, runs, len(runs) - 2)
+
+    return lyst
+
+
+def _min_run_length(length):
+    """
+    Used in natural_mergesort().
+    Returns a run length between MIN_RUN / 2 and MIN_RUN such that
+    length / run length is a power of two or just under one, so the
+    final merges are balanced.
+
+    Parameters
+    ----------
+    length : Int
+        The length of the list
+
+    Returns
+    -------
+    (Int): The minimum run length
+    """
+    extra = 0  # Becomes 1 if any bit shifted off is set
+    while length >= MIN_RUN:
+        extra |= length & 1
+        length >>= 1
+    return length + extra
+
+
+def _find_run(lyst, start, end):
+    """
+    Used in natural_mergesort().
+    Finds the run starting at start. A strictly descending run is
+    reversed in place, so equal values never change order.
+
+    Parameters
+    ----------
+    lyst : List
+        The list being sorted
+    start : Int
+        The first index of the run
+    end : Int
+        One past the last index that can be in the run
+
+    Returns
+    -------
+    (Int): One past the last index of the run
+    """
+    run_end = start + 1
+    if run_end == end:
+        return run_end
+
+    if lyst[run_end] < lyst[start]:
+        # Strictly descending
+        while run_end < end and lyst[run_end] < lyst[run_end - 1]:
+            run_end += 1
+        lyst[start:run_end] = lyst[start:run_end][::-1]
+    else:
+        # Non-descending
+        while run_end < end and not lyst[run_end] < lyst[run_end - 1]:
+            run_end += 1
+
+    return run_end
+
+
+def _collapse_runs(lyst, runs):
+    """
+    Used in natural_mergesort().
+    Merges runs on the top of the stack until, for the top three
+    run lengths A, B and C (C on top), A > B + C and B > C.
+
+    Parameters
+    ----------
+    lyst : List
+        The list being sorted
+    runs : List
+        The stack of [start, length] runs
+    """
+    while len(runs) > 1:
+        top = len(runs) - 2
+        if ((top > 0 and runs[top - 1][1] <= runs[top][1] + runs[top + 1][1])
+                or (top > 1 and runs[top - 2][1] <= runs[top - 1][1] + runs[top][1])):
+            if runs[top - 1][1] < runs[top + 1][1]:
+                top -= 1
+            _merge_at(lyst, runs, top)
+        elif runs[top][1] <= runs[top + 1][1]:
+            _merge_at(lyst, runs, top)
+        else:
+            break
+
+
+def _merge_at(lyst, runs, index):
+    """
+    Used in natural_mergesort().
+    Merges run index with the run after it on the stack.
+
+    Parameters
+    ----------
+    lyst : List
+        The list being sorted
+    runs : List
+        The stack of [start, length] runs
+    index : Int
+        The position on the stack of the first run
+    """
+    start, first_length = runs[index]
+    second_length = runs[index + 1][1]
+    _gallop_merge(lyst, start, start + first_length, start + first_length + second_length)
+
+    runs[index][1] = first_length + second_length
+    del runs[index + 1]
+
+
+def _gallop(seq, value, start, end, right):
+    """
+    Used in _gallop_merge().
+    Finds where value goes in the sorted seq[start:end] by probing
+    at start + 1, 3, 7, 15, ... then binary searching the last gap,
+    so a value near start is found in O(log d) steps.
+
+    Parameters
+    ----------
+    seq : List
+        The sorted list being searched
+    value : Object
+        The value being placed
+    start : Int
+        The first index of the search range
+    end : Int
+        One past the last index of the search range
+    right : Boolean
+        Place value after values equal to it? Otherwise before
+
+    Returns
+    -------
+    (Int): The index value goes at
+    """
+    find = bisect.bisect_right if right else bisect.bisect_left
+    low = start
+    step = 1
+    while low + step <= end:
+        probe = seq[low + step - 1]
+        if value < probe or (not right and not probe < value):
+            return find(seq, value, low, low + step - 1)
+        low += step
+        step *= 2
+    return find(seq, value, low, end)
+
+
+def _gallop_merge(lyst, left, mid, right):
+    """
+    Used in _merge_at().
+    Merges the sorted runs lyst[left:mid] and lyst[mid:right] in place,
+    using a copy of the part of the first run that has to move.
+    Equal values keep their order.
+
+    Parameters
+    ----------
+    lyst : List
+        The list holding the runs
+    left : Int
+        The first index of the first run
+    mid : Int
+        The first index of the second run
+    right : Int
+        One past the last index of the second run
+    """
+    # Values at the start of the first run and the end of the
+    # second run that are already in place don't move
+    left = bisect.bisect_right(lyst, lyst[mid], left, mid)
+    if left == mid:
+        return
+    right = bisect.bisect_left(lyst, lyst[mid - 1], mid, right)
+
+    first = lyst[left:mid]  # The copy of the first run
+    i = 0  # The next value in first
+    j = mid  # The next value in the second run
+    k = left  # The next index written
+    wins_first = 0
+    wins_second = 0
+
+    while i < len(first) and j < right:
+        if wins_first >= MIN_GALLOP or wins_second >= MIN_GALLOP:
+            # Gallop: copy every value of first that goes before lyst[j]...
+            end = _gallop(first, lyst[j], i, len(first), True)
+            first_count = end - i
+            lyst[k:k + first_count] = first[i:end]
+            k += first_count
+            i = end
+            if i == len(first):
+                break
+
+            # ...then every value of the second run that goes before first[i]
+            end = _gallop(lyst, first[i], j, right, False)
+            second_count = end - j
+            lyst[k:k + second_count] = lyst[j:end]
+            k += second_count
+            j = end
+
+            # Stop galloping once it stops paying off
+            if first_count < MIN_GALLOP and second_count < MIN_GALLOP:
+                wins_first = wins_second = 0
+            continue
+
+        if lyst[j] < first[i]:
+            lyst[k] = lyst[j]
+            j += 1
+            wins_second += 1
+            wins_first = 0
+        else:
+            lyst[k] = first[i]
+            i += 1
+            wins_first += 1
+            wins_second = 0
+        k += 1
+
+    # The rest of the second run is already in place
+    lyst[k:k + len(first) - i] = first[i:]
+
+
+@numpy_dispatch("quicksort")
 def quicksort(lyst):
     """
     The recursive helper function for the _quick_sort function.
@@ -300,7 +853,7 @@ def _quick_sort(lyst, left, right):
 
 def _partition(lyst, left, right):
     """
-    Used in the _quick_sort() function.
+    Used in the _quick_sort() and _introselect() functions.
     Used for selecting a pivot value, then
     making all values less than the pivot to
     the right of the pivot. The values greater
@@ -383,21 +936,1016 @@ def _get_pivot(lyst, left, right):
     return first_value[0]
 
 
-def timsort(lyst):
+@numpy_dispatch("quicksort")
+def introsort(lyst):
     """
-    The built-in sorting function in python.
-    Combination of merge-sort and selection-sort.
+    A quick sort hardened against bad inputs:
+      - The pivot is a median of three (or a ninther for long sub-lists)
+      - Three-way partitioning groups values equal to the pivot, so
+        lists with many repeated values don't degrade
+      - Short sub-lists are finished with insertion sort
+      - Only the shorter side is recursed into, so the stack stays O(log n)
+      - Past 2 * log2(n) levels the sub-list is heap sorted instead
+    Together these guarantee O(nlog(n)) on every input.
+    This function mutates lyst
 
-    Paramaters:
+    Parameters:
     -----------
     lyst : List
         The list to be sorted
 
     Returns:
     --------
-    (list): The sorted list
+    lyst : List
+        Returns lyst when done.
     """
-    return sorted(lyst)
+    if len(lyst) > 1:
+        _introsort(lyst, 0, len(lyst) - 1, 2 * int(math.log2(len(lyst))))
+    return lyst
+
+
+def _introsort(lyst, left, right, depth):
+    """
+    Used in introsort().
+    Sorts lyst[left:right + 1] in place.
+
+    Parameters:
+    -----------
+    lyst : List
+        The list to be sorted
+    left : Int
+        The pointer for the left-most value
+    right : Int
+        The pointer for the right-most value
+    depth : Int
+        The number of partitioning levels left before heap sort takes over
+    """
+    while right - left + 1 > INSERTION_THRESHOLD:
+        if depth == 0:
+            _heapsort_range(lyst, left, right)
+            return
+        depth -= 1
+
+        if right - left + 1 > NINTHER_THRESHOLD:
+            pivot = _ninther(lyst, left, right)
+        else:
+            pivot = _median_of_three(lyst[left], lyst[(left + right) // 2], lyst[right])
+        lesser, greater = _three_way_partition(lyst, left, right, pivot)
+
+        # Recurse into the shorter side and loop on the longer one
+        if lesser - left < right - greater:
+            _introsort(lyst, left, lesser - 1, depth)
+            left = greater + 1
+        else:
+            _introsort(lyst, greater + 1, right, depth)
+            right = lesser - 1
+
+    _binary_insertion_sort(lyst, left, right)
+
+
+def _median_of_three(first, second, third):
+    """
+    Used in _introsort().
+    Returns the median of three values without building a list.
+
+    Parameters:
+    -----------
+    first : Object
+        The first value
+    second : Object
+        The second value
+    third : Object
+        The third value
+
+    Returns:
+    --------
+    (Object): The middle of the three values
+    """
+    if first < second:
+        if second < third:
+            return second
+        return third if first < third else first
+    if first < third:
+        return first
+    return third if second < third else second
+
+
+def _ninther(lyst, left, right):
+    """
+    Used in _introsort().
+    Returns the median of the medians of three groups of three values
+    spread across the sub-list, a better pivot guess for long sub-lists.
+
+    Parameters:
+    -----------
+    lyst : List
+        The list being partitioned
+    left : Int
+        The pointer for the left-most value
+    right : Int
+        The pointer for the right-most value
+
+    Returns:
+    --------
+    (Object): The pivot value
+    """
+    step = (right - left) // 8
+    mid = (left + right) // 2
+    return _median_of_three(
+        _median_of_three(lyst[left], lyst[left + step], lyst[left + 2 * step]),
+        _median_of_three(lyst[mid - step], lyst[mid], lyst[mid + step]),
+        _median_of_three(lyst[right - 2 * step], lyst[right - step], lyst[right]),
+    )
+
+
+def _three_way_partition(lyst, left, right, pivot):
+    """
+    Used in _introsort().
+    Partitions lyst[left:right + 1] into values less than, equal to and
+    greater than pivot (Dijkstra's Dutch national flag partition).
+
+    Parameters:
+    -----------
+    lyst : List
+        The list being partitioned
+    left : Int
+        The pointer for the left-most value
+    right : Int
+        The pointer for the right-most value
+    pivot : Object
+        The pivot value
+
+    Returns:
+    --------
+    (Tuple): (lesser, greater), the first and last index of the
+        values equal to pivot
+    """
+    lesser = left  # Everything before lesser is less than pivot
+    current = left  # Everything from lesser to current is equal to pivot
+    greater = right  # Everything after greater is greater than pivot
+
+    while current <= greater:
+        value = lyst[current]
+        if value < pivot:
+            lyst[current] = lyst[lesser]
+            lyst[lesser] = value
+            lesser += 1
+            current += 1
+        elif pivot < value:
+            lyst[current] = lyst[greater]
+            lyst[greater] = value
+            greater -= 1
+        else:
+            current += 1
+
+    return lesser, greater
+
+
+def _heapsort_range(lyst, left, right):
+    """
+    Used in _introsort().
+    Heap sorts lyst[left:right + 1] in place in O(nlog(n)).
+
+    Parameters:
+    -----------
+    lyst : List
+        The list being sorted
+    left : Int
+        The pointer for the left-most value
+    right : Int
+        The pointer for the right-most value
+    """
+    length = right - left + 1
+
+    # Build a max heap over the sub-list
+    for root in range(length // 2 - 1, -1, -1):
+        _sift_down(lyst, left, root, length)
+
+    # Move the largest value to the end and restore the heap
+    for end in range(length - 1, 0, -1):
+        swap(lyst, left, left + end)
+        _sift_down(lyst, left, 0, end)
+
+
+def _sift_down(lyst, offset, root, length):
+    """
+    Used in _heapsort_range().
+    Moves the value at root down the max heap stored in
+    lyst[offset:offset + length] until both its children are smaller.
+
+    Parameters:
+    -----------
+    lyst : List
+        The list holding the heap
+    offset : Int
+        The index of the heap's first value
+    root : Int
+        The heap position of the value being moved
+    length : Int
+        The number of values in the heap
+    """
+    value = lyst[offset + root]
+    child = 2 * root + 1
+    while child < length:
+        # Pick the larger child
+        if child + 1 < length and lyst[offset + child] < lyst[offset + child + 1]:
+            child += 1
+        if not value < lyst[offset + child]:
+            break
+        lyst[offset + root] = lyst[offset + child]
+        root = child
+        child = 2 * root + 1
+    lyst[offset + root] = value
+
+
+def nth_element(lyst, index):
+    """
+    Partially sorts a list so the value at index is the one that would
+    be there if the list were sorted. Every value before it is no
+    greater, and every value after it is no less. Takes O(n) time.
+    A NumPy array is partitioned with numpy's partition() instead.
+    This function mutates lyst
+
+    Parameters:
+    -----------
+    lyst : List | numpy.ndarray
+        The list to be partitioned
+    index : Int
+        The index whose value is wanted
+
+    Returns:
+    --------
+    lyst : List | numpy.ndarray
+        Returns lyst when done.
+
+    Raises:
+    -------
+    IndexError: If index is not an index of lyst
+    """
+    if not 0 <= index < len(lyst):
+        raise IndexError(f"index {index} is out of range for {len(lyst)} values")
+
+    if numpy is not None and isinstance(lyst, numpy.ndarray):
+        lyst.partition(index)
+    else:
+        _introselect(lyst, 0, len(lyst) - 1, index)
+    return lyst
+
+
+def quickselect(lyst, index):
+    """
+    Returns the value that would be at index if the list were sorted,
+    without sorting it. Takes O(n) time.
+    This function mutates lyst, as nth_element() does
+
+    Parameters:
+    -----------
+    lyst : List | numpy.ndarray
+        The list being searched
+    index : Int
+        The index in sorted order, so 0 is the smallest value
+        and len(lyst) // 2 is the median
+
+    Returns:
+    --------
+    (Object): The value
+
+    Raises:
+    -------
+    IndexError: If index is not an index of lyst
+    """
+    return nth_element(lyst, index)[index]
+
+
+def partial_sort(lyst, count):
+    """
+    Sorts only the smallest count values of a list into its first count
+    places. The order of the rest is unspecified. Takes O(n + klog(k))
+    time for k = count.
+    This function mutates lyst
+
+    Parameters:
+    -----------
+    lyst : List | numpy.ndarray
+        The list to be partially sorted
+    count : Int
+        The number of values to sort
+
+    Returns:
+    --------
+    lyst : List | numpy.ndarray
+        Returns lyst when done.
+    """
+    count = min(count, len(lyst))
+    if count <= 0:
+        return lyst
+
+    nth_element(lyst, count - 1)
+    if numpy is not None and isinstance(lyst, numpy.ndarray):
+        lyst[:count].sort()
+    elif count > 1:
+        _introsort(lyst, 0, count - 1, 2 * int(math.log2(count)))
+    return lyst
+
+
+def top_k(data, count, largest=True):
+    """
+    Returns the count largest (or smallest) values, in order, without
+    changing data. Only a heap of count values is kept, so it takes
+    O(nlog(k)) time for k = count and works on any iterable.
+
+    Parameters:
+    -----------
+    data : Iterable | numpy.ndarray
+        The values being searched
+    count : Int
+        The number of values wanted
+    largest : Boolean
+        Return the largest values, largest first? If not, return
+        the smallest values, smallest first
+
+    Returns:
+    --------
+    (List | numpy.ndarray): The values
+    """
+    if numpy is not None and isinstance(data, numpy.ndarray):
+        count = min(count, data.size)
+        if count <= 0:
+            return data[:0].copy()
+        if largest:
+            return numpy.sort(numpy.partition(data, data.size - count)[data.size - count:])[::-1]
+        return numpy.sort(numpy.partition(data, count - 1)[:count])
+
+    if largest:
+        return heapq.nlargest(count, data)
+    return heapq.nsmallest(count, data)
+
+
+def sorted_iter(data):
+    """
+    Yields the values of data from smallest to largest, doing only as
+    much sorting as has been asked for. The values are heapified in
+    O(n) time and each one is popped as it is needed, so the first k
+    values take O(n + klog(n)) time and stopping early skips the rest.
+    Equal values may come out in any order. data is not changed.
+
+    Parameters:
+    -----------
+    data : Iterable | numpy.ndarray
+        The values to be sorted
+
+    Yields:
+    -------
+    (Object): The next smallest value
+    """
+    if numpy is not None and isinstance(data, numpy.ndarray):
+        heap = data.tolist()
+    else:
+        heap = list(data)
+    heapq.heapify(heap)
+
+    pop = heapq.heappop
+    while heap:
+        yield pop(heap)
+
+
+def _introselect(lyst, left, right, index):
+    """
+    Used in nth_element().
+    Quickselect with _partition(): only the side holding index is
+    partitioned again. If four partitions in a row fail to halve the
+    sub-list, the pivots are going badly and _median_select() takes
+    over, which keeps the worst case at O(n). Fewer than four often
+    fails by chance on random data, and the fallback is much slower.
+
+    Parameters:
+    -----------
+    lyst : List
+        The list being partitioned
+    left : Int
+        The pointer for the left-most value
+    right : Int
+        The pointer for the right-most value
+    index : Int
+        The index whose value is wanted
+    """
+    limit = right - left + 1
+    partitions = 0
+    while right - left + 1 > INSERTION_THRESHOLD:
+        if partitions == 4:
+            if right - left + 1 > limit // 2:
+                _median_select(lyst, left, right, index)
+                return
+            limit = right - left + 1
+            partitions = 0
+        partitions += 1
+
+        pivot = _partition(lyst, left, right)
+        if index < pivot:
+            right = pivot - 1
+        elif pivot < index:
+            left = pivot + 1
+        else:
+            return
+
+    _binary_insertion_sort(lyst, left, right)
+
+
+def _median_select(lyst, left, right, index):
+    """
+    Used in _introselect() and _median_of_medians().
+    Selection that always takes O(n) time: the pivot is the median of
+    medians, and the three-way partition puts every value equal to it
+    in place at once, so repeated values can't slow it down.
+
+    Parameters:
+    -----------
+    lyst : List
+        The list being partitioned
+    left : Int
+        The pointer for the left-most value
+    right : Int
+        The pointer for the right-most value
+    index : Int
+        The index whose value is wanted
+    """
+    while right - left + 1 > INSERTION_THRESHOLD:
+        pivot = _median_of_medians(lyst, left, right)
+        lesser, greater = _three_way_partition(lyst, left, right, pivot)
+        if index < lesser:
+            right = lesser - 1
+        elif greater < index:
+            left = greater + 1
+        else:
+            return
+
+    _binary_insertion_sort(lyst, left, right)
+
+
+def _median_of_medians(lyst, left, right):
+    """
+    Used in _median_select().
+    Returns the median of the medians of groups of five values. At least
+    3/10 of the sub-list is less than it and 3/10 is greater.
+
+    Parameters:
+    -----------
+    lyst : List
+        The list being partitioned
+    left : Int
+        The pointer for the left-most value
+    right : Int
+        The pointer for the right-most value
+
+    Returns:
+    --------
+    (Object): The pivot value
+    """
+    medians = []
+    for start in range(left, right + 1, 5):
+        group = lyst[start:min(start + 5, right + 1)]
+        _binary_insertion_sort(group, 0, len(group) - 1)
+        medians.append(group[len(group) // 2])
+
+    middle = len(medians) // 2
+    _median_select(medians, 0, len(medians) - 1, middle)
+    return medians[middle]
+
+
+@numpy_dispatch("timsort")
+def timsort(lyst):
+    """
+    The built-in sorting function in python.
+    Combination of merge-sort and selection-sort.
+
+    Paramaters:
+    -----------
+    lyst : List
+        The list to be sorted
+
+    Returns:
+    --------
+    (list): The sorted list
+    """
+    return sorted(lyst)
+
+
+def radix_sort(lyst):
+    """
+    Sorts a list of integers with a least significant digit radix sort,
+    one byte (8 bits) per pass. Negative values are handled by shifting
+    every value up by the minimum first. Takes O(n * k) time, where k is
+    the number of bytes in the range of the values.
+    A NumPy array is sorted with vectorized passes instead.
+    This function mutates lyst
+
+    Parameters:
+    -----------
+    lyst : List | numpy.ndarray
+        The integers to be sorted
+
+    Returns:
+    --------
+    lyst : List | numpy.ndarray
+        Returns lyst when done.
+
+    Raises:
+    -------
+    TypeError: If a value (or a NumPy array's dtype) isn't an integer
+    """
+    if numpy is not None and isinstance(lyst, numpy.ndarray):
+        return _radix_sort_numpy(lyst)
+    if len(lyst) < 2:
+        return lyst
+
+    smallest = min(lyst)
+    keys = [value - smallest for value in lyst]  # Every key is now >= 0
+    largest = max(keys)
+
+    shift = 0
+    while largest >> shift:
+        # Deal the keys into 256 buckets by the current byte; each
+        # bucket keeps the order of the last pass, so the sort is stable.
+        # Lists, not arrays: a counting pass that scatters into an
+        # array('Q') is about a third slower, since every array access
+        # boxes or unboxes an int
+        buckets = [[] for _ in range(256)]
+        for key in keys:
+            buckets[(key >> shift) & 255].append(key)
+        keys = list(chain.from_iterable(buckets))
+        shift += 8
+
+    lyst[:] = [key + smallest for key in keys]
+    return lyst
+
+
+def _radix_sort_numpy(values):
+    """
+    Used in radix_sort().
+    Radix sorts a NumPy integer array in place, one byte per pass.
+    Each pass is a stable sort of 8 bit digits, which NumPy does
+    with a counting sort.
+
+    Parameters:
+    -----------
+    values : numpy.ndarray
+        The integers to be sorted
+
+    Returns:
+    --------
+    values : numpy.ndarray
+        Returns values when done.
+
+    Raises:
+    -------
+    TypeError: If the array's dtype isn't an integer type
+    """
+    _check_integer_dtype(values, "radix_sort")
+    if values.size < 2:
+        return values
+
+    smallest = int(values.min())
+    keys = (values.astype(numpy.int64) - smallest).astype(numpy.uint64)
+    largest = int(keys.max())
+
+    shift = 0
+    while largest >> shift:
+        digits = ((keys >> numpy.uint64(shift)) & numpy.uint64(255)).astype(numpy.uint8)
+        keys = keys[numpy.argsort(digits, kind="stable")]
+        shift += 8
+
+    values[...] = (keys.astype(numpy.int64) + smallest).astype(values.dtype)
+    return values
+
+
+def _check_integer_dtype(values, name):
+    """
+    Used in _radix_sort_numpy() and counting_sort().
+    Rejects NumPy arrays that don't hold integers, which the integer
+    sorts would otherwise truncate.
+
+    Parameters:
+    -----------
+    values : numpy.ndarray
+        The array being sorted
+    name : str
+        The name of the sort, for the error message
+
+    Raises:
+    -------
+    TypeError: If the array's dtype isn't an integer type
+    """
+    if not numpy.issubdtype(values.dtype, numpy.integer):
+        raise TypeError(f"{name}() needs integers, not an array of {values.dtype}")
+
+
+def counting_sort(lyst):
+    """
+    Sorts a list of integers from a narrow range by counting how many
+    times each value appears. Takes O(n + r) time, where r is the
+    range of the values.
+    A NumPy array is counted with numpy.bincount instead.
+    This function mutates lyst
+
+    Parameters:
+    -----------
+    lyst : List | numpy.ndarray
+        The integers to be sorted
+
+    Returns:
+    --------
+    lyst : List | numpy.ndarray
+        Returns lyst when done.
+
+    Raises:
+    -------
+    ValueError: If the range is wider than COUNTING_RANGE_LIMIT.
+        Use radix_sort() for wide ranges.
+    TypeError: If a value (or a NumPy array's dtype) isn't an integer
+    """
+    if numpy is not None and isinstance(lyst, numpy.ndarray):
+        _check_integer_dtype(lyst, "counting_sort")
+    if len(lyst) < 2:
+        return lyst
+
+    smallest = int(min(lyst))
+    value_range = int(max(lyst)) - smallest + 1
+    if value_range > COUNTING_RANGE_LIMIT:
+        raise ValueError(f"range of {value_range} is too wide for counting_sort()")
+
+    if numpy is not None and isinstance(lyst, numpy.ndarray):
+        # Subtracting in the array's own dtype could overflow a narrow type
+        counts = numpy.bincount(lyst.astype(numpy.intp) - smallest, minlength=value_range)
+        values = numpy.arange(smallest, smallest + value_range, dtype=lyst.dtype)
+        lyst[...] = numpy.repeat(values, counts)
+        return lyst
+
+    # A list, not an array: incrementing array items is slower, and
+    # takes the same 8 bytes per count
+    counts = [0] * value_range
+    for value in lyst:
+        counts[value - smallest] += 1
+
+    lyst[:] = chain.from_iterable(
+        repeat(offset + smallest, count) for offset, count in enumerate(counts) if count
+    )
+    return lyst
+
+
+def analyze(lyst):
+    """
+    Measures how sorted a list already is, in one pass over it.
+    The inversion count and duplicate ratio are estimated from
+    SAMPLE_SIZE evenly spaced values.
+
+    Parameters:
+    -----------
+    lyst : List | numpy.ndarray
+        The values being profiled
+
+    Returns:
+    --------
+    (dict): The length, the number of ascending runs, the estimated
+        number of inversions, the estimated fraction of duplicate values,
+        the smallest and largest values (None for an array of strings
+        or objects), whether the values are integers, for integers the
+        number of values in the key range, and the number of NaNs in a
+        float array
+    """
+    length = len(lyst)
+    profile = {
+        "length": length,
+        "runs": min(length, 1),
+        "inversions": 0,
+        "duplicate_ratio": 0.0,
+        "minimum": None,
+        "maximum": None,
+        "integers": False,
+        "key_range": None,
+        "nans": 0,
+    }
+    if not length:
+        return profile
+
+    count = min(length, SAMPLE_SIZE)
+    sample = [lyst[i * length // count] for i in range(count)]
+
+    if numpy is not None and isinstance(lyst, numpy.ndarray):
+        if numpy.issubdtype(lyst.dtype, numpy.number):
+            # A pair with a NaN in it is never >=, so it counts as a descent
+            descents = int(numpy.count_nonzero(~(lyst[1:] >= lyst[:-1])))
+            smallest, largest = lyst.min().item(), lyst.max().item()
+            integers = bool(numpy.issubdtype(lyst.dtype, numpy.integer))
+            if numpy.issubdtype(lyst.dtype, numpy.inexact):
+                profile["nans"] = int(numpy.count_nonzero(numpy.isnan(lyst)))
+        else:
+            # Strings and objects can be compared but have no min(), and
+            # only numbers are counted, so their extremes aren't needed
+            descents = int(numpy.count_nonzero(lyst[1:] < lyst[:-1]))
+            smallest = largest = None
+            integers = False
+    else:
+        values = iter(lyst)
+        smallest = largest = previous = next(values)
+        descents = 0
+        for value in values:
+            # A value below the one before it can only be a new minimum,
+            # and any other value can only be a new maximum
+            if value < previous:
+                descents += 1
+                if value < smallest:
+                    smallest = value
+            elif largest < value:
+                largest = value
+            previous = value
+        # Checking every value would double the cost of the pass, so only
+        # the extremes and the sample are checked. counting_sort() raises
+        # TypeError on anything else, and sort() falls back to timsort
+        integers = all(type(value) is int for value in chain((smallest, largest), sample))
+
+    sample_inversions, distinct = _sample_disorder(sample)
+    pairs = count * (count - 1) // 2
+
+    profile.update({
+        "runs": descents + 1,
+        "inversions": round(sample_inversions / pairs * length * (length - 1) / 2) if pairs else 0,
+        "duplicate_ratio": 1 - distinct / count,
+        "minimum": smallest,
+        "maximum": largest,
+        "integers": integers,
+        "key_range": largest - smallest + 1 if integers else None,
+    })
+    return profile
+
+
+def _sample_disorder(sample):
+    """
+    Used in analyze().
+    Counts the inversions and distinct values in a small sample by
+    inserting each value into a sorted list.
+
+    Parameters:
+    -----------
+    sample : List
+        The sampled values, in their original order
+
+    Returns:
+    --------
+    (tuple): The number of inversions and the number of distinct values
+    """
+    ordered = []
+    inversions = 0
+    for seen, value in enumerate(sample):
+        # Every value already placed that is greater than value is an inversion
+        index = bisect.bisect_right(ordered, value)
+        inversions += seen - index
+        ordered.insert(index, value)
+
+    distinct = sum(1 for i in range(len(ordered)) if not i or ordered[i - 1] < ordered[i])
+    return inversions, distinct
+
+
+def _choose_strategy(profile, is_array=False):
+    """
+    Used in sort().
+    Picks the cheapest way to sort a list with the given profile.
+
+    Parameters:
+    -----------
+    profile : dict
+        The profile from analyze()
+    is_array : Boolean
+        Is the data a NumPy array?
+
+    Returns:
+    --------
+    (str): "sorted" if there is nothing to do, "reversed" if the values
+        only need reversing, "counting_sort" for integers from a range no
+        wider than the list, and otherwise "numpy" for an array or
+        "timsort" for a list
+    """
+    length = profile["length"]
+    if profile["nans"]:
+        # NaNs compare false to everything, so the runs can't be trusted.
+        # NumPy's sort puts them last
+        return "numpy"
+    if profile["runs"] <= 1:
+        return "sorted"
+    if profile["runs"] == length:
+        # Strictly descending, so reversing it can't reorder equal values
+        return "reversed"
+    if profile["integers"] and profile["key_range"] <= min(length, COUNTING_RANGE_LIMIT):
+        return "counting_sort"
+    return "numpy" if is_array else "timsort"
+
+
+def sort(lyst, key=None):
+    """
+    Sorts a list with whichever strategy suits it best. The list is
+    profiled with analyze() first, so sorted and reversed lists take
+    O(n) time, integers from a narrow range are counted, and anything
+    else goes to the fastest general sort available: list.sort(), or
+    NumPy's sort for a NumPy array. The pure Python comparison sorts
+    in this module are never picked: list.sort() runs the same ideas
+    (natural runs, galloping, binary insertion) in C, and beats each
+    of them on every input profile.
+    With a key, each key is computed exactly once. A list is sorted
+    by list.sort(key=key), which keeps the keys in a parallel array in
+    C. A NumPy array's keys go into a parallel list, its order is found
+    with argsort() on the keys alone, and the values are moved once.
+    This function mutates lyst
+
+    Parameters:
+    -----------
+    lyst : List | numpy.ndarray
+        The list to be sorted
+    key : Function
+        Called once on each value to get what it is sorted by.
+        Defaults to sorting by the values themselves
+
+    Returns:
+    --------
+    lyst : List | numpy.ndarray
+        Returns lyst when done.
+    """
+    is_array = numpy is not None and isinstance(lyst, numpy.ndarray)
+    if key is not None:
+        if is_array:
+            return _sort_by_keys(lyst, list(map(key, lyst)))
+        # Twice as fast as sorting a permutation and gathering the values
+        lyst.sort(key=key)
+        return lyst
+
+    # is_sorted() stops at the first value out of order, so it is a
+    # cheap first check. An array is checked by analyze() instead
+    if not is_array and is_sorted(lyst):
+        return lyst
+
+    strategy = _choose_strategy(analyze(lyst), is_array)
+
+    if strategy == "reversed":
+        if is_array:
+            lyst[...] = lyst[::-1].copy()
+        else:
+            lyst.reverse()
+    elif strategy == "counting_sort":
+        try:
+            counting_sort(lyst)
+        except TypeError:
+            # A value the sample missed isn't an integer. counting_sort()
+            # fails while counting, before it writes to lyst
+            lyst.sort()
+    elif strategy == "numpy":
+        lyst.sort(kind="stable")
+    elif strategy == "timsort":
+        lyst.sort()
+    return lyst
+
+
+def _sort_by_keys(lyst, keys):
+    """
+    Used in sort().
+    Puts an array in the order that sorts keys, its parallel list of keys.
+
+    Parameters:
+    -----------
+    lyst : numpy.ndarray
+        The array to be sorted
+    keys : List
+        keys[i] is what lyst[i] is sorted by
+
+    Returns:
+    --------
+    lyst : numpy.ndarray
+        Returns lyst when done.
+    """
+    if is_sorted(keys):
+        return lyst
+
+    # The order stays a list; building an array of it here would
+    # only be thrown away
+    lyst[...] = lyst[_argsort_keys(keys)]
+    return lyst
+
+
+def argsort(data, key=None):
+    """
+    Returns the indexes of data in the order that sorts it, so
+    data[order[0]] is the smallest value. data is not changed, and
+    each key is computed only once. Equal values keep their order.
+
+    Parameters:
+    -----------
+    data : Sequence | numpy.ndarray
+        The values to be sorted
+    key : Function
+        Called once on each value to get what it is sorted by.
+        Defaults to sorting by the values themselves
+
+    Returns:
+    --------
+    (array | numpy.ndarray): The indexes, as an array of 8 byte
+        integers, or an ndarray of indexes for an ndarray and no key
+    """
+    if key is None:
+        if numpy is not None and isinstance(data, numpy.ndarray):
+            return numpy.argsort(data, kind="stable")
+        keys = data
+    else:
+        keys = list(map(key, data))
+
+    return array.array("q", _argsort_keys(keys))
+
+
+def _argsort_keys(keys):
+    """
+    Used in argsort() and _sort_by_keys().
+    Sorts the indexes of keys by the keys. Only the keys are compared;
+    the values they belong to never move.
+
+    Parameters:
+    -----------
+    keys : Sequence
+        The keys being sorted
+
+    Returns:
+    --------
+    (List): The indexes, in the order that sorts keys
+    """
+    return sorted(range(len(keys)), key=keys.__getitem__)
+
+
+def merge_benchmark(size=1_000_000):
+    """
+    Times mergesort() against buffered_mergesort() and
+    bottom_up_mergesort() on copies of the same data.
+
+    Parameters:
+    -----------
+    size : Int
+        The size of the dataset
+    """
+    data_gen = make_data(size)
+
+    time_it(mergesort)(next(data_gen))
+    time_it(buffered_mergesort)(next(data_gen))
+    time_it(bottom_up_mergesort)(next(data_gen))
+
+
+def integer_benchmark(size=10_000_000):
+    """
+    Times timsort() against radix_sort() and counting_sort() on
+    copies of the same data.
+
+    Parameters:
+    -----------
+    size : Int
+        The size of the dataset
+    """
+    data_gen = make_data(size)
+
+    time_it(timsort)(next(data_gen))
+    time_it(radix_sort)(next(data_gen))
+    time_it(counting_sort)(next(data_gen))
+
+
+def natural_benchmark(size=1_000_000):
+    """
+    Times timsort() against natural_mergesort() and mergesort() on
+    random data, then on nearly sorted data.
+
+    Parameters:
+    -----------
+    size : Int
+        The size of the dataset
+    """
+    data_gen = make_data(size)
+    presorted = sorted(next(data_gen))
+    # Swap a few neighbours, so the data is mostly but not completely sorted
+    for i in range(0, size - 1, 1000):
+        swap(presorted, i, i + 1)
+
+    for data in (next(data_gen), presorted):
+        time_it(timsort)(data[:])
+        time_it(natural_mergesort)(data[:])
+        time_it(mergesort)(data[:])
+
+
+def selection_benchmark(size=1_000_000):
+    """
+    Times timsort() against quickselect() for the median, and
+    top_k() for the largest 100 values, on copies of the same data.
+
+    Parameters:
+    -----------
+    size : Int
+        The size of the dataset
+    """
+    data_gen = make_data(size)
+
+    time_it(timsort)(next(data_gen))
+    time_it(quickselect)(next(data_gen), size // 2)
+    time_it(top_k)(next(data_gen), 100)
 
 
 def main():
@@ -409,6 +1957,7 @@ def main():
         - mergesort()
         - quicksort()
         - timsort()
+    See benchmark.py for a full benchmark suite.
     """
     data_size = 50000
     data_gen = make_data(data_size)
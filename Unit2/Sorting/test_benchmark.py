@@ -0,0 +1,59 @@
+import json
+from benchmark import (make_distribution, DISTRIBUTIONS, count_operations, run_suite,
+                       save_report, load_report, diff_reports)
+from sort import make_data, insertion_sort, selection_sort, timsort, radix_sort
+
+
+def test_distributions():
+    for name in DISTRIBUTIONS:
+        data = make_distribution(name, 1000)
+        assert len(data) == 1000
+        assert make_distribution(name, 1000) == data
+
+    assert make_distribution("sorted", 5) == [0, 1, 2, 3, 4]
+    assert make_distribution("reversed", 3) == [3, 2, 1]
+    assert make_distribution("organ_pipe", 6) == [0, 1, 2, 3, 2, 1]
+    assert len(set(make_distribution("few_unique", 1000))) <= 10
+
+
+def test_make_data_fresh_copies():
+    data_gen = make_data(100)
+    first = next(data_gen)
+    insertion_sort(first)
+    assert next(data_gen) != first
+
+
+def test_count_operations():
+    counts = count_operations(selection_sort, [3, 1, 2])
+    assert counts["comparisons"] == 5
+    assert counts["swaps"] == 2
+    assert counts["writes"] == 4
+
+    assert count_operations(timsort, [3, 1, 2])["comparisons"] > 0
+    assert count_operations(radix_sort, [3, 1, 2])["comparisons"] is None
+
+
+def test_run_suite_and_diff(tmp_path):
+    report = run_suite(["insertion_sort", "quicksort", "timsort", "counting_sort"],
+                       ["random", "few_unique"], [100, 2000], repeat=3, warmup=1,
+                       verbose=False)
+    results = report["results"]
+
+    assert len(results) == 16
+    for entry in results:
+        if "error" not in entry:
+            assert entry["correct"]
+            assert entry["median"] <= entry["p95"]
+
+    path = str(tmp_path / "report.json")
+    save_report(report, path)
+    assert load_report(path) == json.loads(json.dumps(report))
+
+    slower = json.loads(json.dumps(report))
+    for entry in slower["results"]:
+        if "median" in entry:
+            entry["median"] *= 2
+    changes = diff_reports(report, slower)
+    assert changes
+    assert all(change["status"] == "regression" for change in changes)
+    assert all(change["status"] == "same" for change in diff_reports(report, report))
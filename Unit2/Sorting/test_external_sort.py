@@ -0,0 +1,76 @@
+import array
+from random import seed, sample
+from sort import introsort
+import external_sort as external_sort_module
+from external_sort import external_sort
+
+
+def make_data(data_size):
+    seed(42)
+    return sample(range(-data_size * 2, data_size * 2), k=data_size)
+
+
+def test_external_sort_text(tmp_path):
+    data = make_data(20000)
+    input_path = tmp_path / "input.txt"
+    output_path = tmp_path / "output.txt"
+    input_path.write_text("".join(f"{value}\n" for value in data))
+
+    # 1000 values per run, and only two runs merged at once
+    stats = external_sort(str(input_path), str(output_path), memory_budget=40000,
+                          temp_dir=str(tmp_path))
+
+    result = [int(line) for line in output_path.read_text().split()]
+    assert result == sorted(data)
+    assert stats["values"] == len(data)
+    assert stats["runs"] == 20
+    assert stats["merge_passes"] == 5
+    assert stats["bytes_read"] > 0 and stats["bytes_written"] > 0
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["input.txt", "output.txt"]
+
+
+def test_external_sort_binary(tmp_path):
+    data = make_data(5000)
+    input_path = tmp_path / "input.bin"
+    output_path = tmp_path / "output.bin"
+    with open(input_path, "wb") as file:
+        array.array("q", data).tofile(file)
+
+    stats = external_sort(str(input_path), str(output_path), memory_budget=1 << 20,
+                          binary=True, algorithm=introsort)
+
+    result = array.array("q")
+    with open(output_path, "rb") as file:
+        result.frombytes(file.read())
+    assert result.tolist() == sorted(data)
+    assert stats["runs"] == 1
+
+
+def test_external_sort_fan_in_cap(tmp_path, monkeypatch):
+    data = make_data(50000)
+    input_path = tmp_path / "input.bin"
+    output_path = tmp_path / "output.bin"
+    with open(input_path, "wb") as file:
+        array.array("q", data).tofile(file)
+
+    # The budget allows five runs per merge, so the cap of three costs a pass
+    monkeypatch.setattr(external_sort_module, "MAX_FAN_IN", 3)
+    stats = external_sort(str(input_path), str(output_path), memory_budget=400000,
+                          binary=True, temp_dir=str(tmp_path))
+
+    result = array.array("q")
+    with open(output_path, "rb") as file:
+        result.frombytes(file.read())
+    assert result.tolist() == sorted(data)
+    assert stats["runs"] == 5
+    assert stats["merge_passes"] == 2
+
+
+def test_external_sort_empty(tmp_path):
+    input_path = tmp_path / "empty.txt"
+    output_path = tmp_path / "sorted.txt"
+    input_path.write_text("")
+
+    stats = external_sort(str(input_path), str(output_path))
+    assert output_path.read_text() == ""
+    assert stats["runs"] == 0
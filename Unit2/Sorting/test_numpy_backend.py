@@ -0,0 +1,61 @@
+import pytest
+from sort import selection_sort, insertion_sort, mergesort, quicksort, timsort
+from sort import buffered_mergesort, bottom_up_mergesort, introsort
+
+numpy = pytest.importorskip("numpy")
+
+
+def make_data(data_size):
+    generator = numpy.random.default_rng(42)
+    return generator.integers(-data_size * 2, data_size * 2, size=data_size)
+
+
+def test_numpy_dispatch():
+    sorts = (selection_sort, insertion_sort, mergesort, quicksort,
+             buffered_mergesort, bottom_up_mergesort, introsort)
+    inputs = [
+        make_data(1000),
+        make_data(33),
+        numpy.arange(500),
+        numpy.arange(500)[::-1].copy(),
+        numpy.random.default_rng(1).integers(0, 3, size=700),
+        numpy.random.default_rng(2).random(300),
+        numpy.array([], dtype=numpy.int64),
+        numpy.array([str(x) for x in make_data(300)]),
+    ]
+    for data in inputs:
+        for sort in sorts:
+            test = data.copy()
+            result = sort(test)
+            assert result is test
+            assert isinstance(result, numpy.ndarray)
+            assert (result == numpy.sort(data)).all()
+
+
+def test_numpy_quicksort_nan():
+    data = numpy.array([3.0, numpy.nan, 1.0, 2.0] * 20)
+    for sort in (quicksort, introsort):
+        result = sort(data.copy())
+        assert numpy.isnan(result).sum() == 20
+        assert (result[:60] == numpy.sort(data)[:60]).all()
+
+    # A NaN in every pivot position, and a partition of only NaNs
+    data = numpy.arange(80.0)
+    data[[0, 40, 79]] = numpy.nan
+    result = quicksort(data.copy())
+    assert numpy.isnan(result[-3:]).all()
+    assert (result[:-3] == numpy.sort(data)[:-3]).all()
+    assert numpy.isnan(quicksort(numpy.full(50, numpy.nan))).all()
+
+
+def test_numpy_timsort():
+    data = make_data(100)
+    result = timsort(data)
+    assert (result == numpy.sort(data)).all()
+    assert result is not data
+
+
+def test_lists_still_sorted_in_python():
+    data = [3, 1, 2]
+    assert quicksort(data) == [1, 2, 3]
+    assert mergesort.__name__ == "mergesort"
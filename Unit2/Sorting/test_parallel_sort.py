@@ -0,0 +1,52 @@
+from random import seed, sample, random
+import parallel_sort
+from parallel_sort import parallel_sort as psort, speedup
+
+
+def make_data(data_size):
+    seed(42)
+    return sample(range(-data_size, data_size * 2), k=data_size)
+
+
+def test_parallel_sort(monkeypatch):
+    monkeypatch.setattr(parallel_sort, "PARALLEL_THRESHOLD", 0)
+
+    for workers in (2, 3, 5):
+        data = make_data(10007)
+        test = data.copy()
+        assert psort(test, workers=workers) is test
+        assert test == sorted(data)
+
+    floats = [random() for _ in range(1000)]
+    assert psort(floats.copy(), workers=3) == sorted(floats)
+
+
+def test_serial_fallback(monkeypatch):
+    monkeypatch.setattr(parallel_sort, "PARALLEL_THRESHOLD", 0)
+
+    words = ["pear", "apple", "fig"]
+    assert psort(words, workers=2) == ["apple", "fig", "pear"]
+    huge = [2 ** 70, 1, -2 ** 70]
+    assert psort(huge, workers=2) == [-2 ** 70, 1, 2 ** 70]
+    assert psort([], workers=2) == []
+
+    # Bools and mixed types aren't packed, so they come back unchanged
+    flags = [True, False, True]
+    result = psort(flags.copy(), workers=2)
+    assert result == [False, True, True]
+    assert all(type(value) is bool for value in result)
+    assert psort([2, 1.5, 1], workers=2) == [1, 1.5, 2]
+
+
+def test_merge_runs(monkeypatch):
+    monkeypatch.setattr(parallel_sort, "PARALLEL_THRESHOLD", 0)
+    # Runs that are already in order are copied without a merge
+    data = list(range(5000))
+    assert psort(data.copy(), workers=4) == data
+    data = list(range(5000, 0, -1))
+    assert psort(data.copy(), workers=4) == sorted(data)
+
+
+def test_speedup():
+    times = speedup(size=2000, workers=2)
+    assert set(times) == {"mergesort", "timsort", "parallel_sort"}
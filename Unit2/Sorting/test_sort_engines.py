@@ -0,0 +1,371 @@
+import pytest
+from itertools import islice
+from random import seed, sample, randint
+from sort import buffered_mergesort, bottom_up_mergesort, introsort
+from sort import _introsort, _heapsort_range
+from sort import radix_sort, counting_sort, natural_mergesort
+from sort import binary_insertion_sort, _binary_insertion_sort
+from sort import is_sorted, analyze, sort, _choose_strategy
+from sort import nth_element, quickselect, partial_sort, top_k, _median_select
+from sort import sorted_iter, argsort
+
+
+def make_data(data_size):
+    seed(42)
+    return sample(range(data_size * 3), k=data_size)
+
+
+def test_buffered_mergesorts():
+    for data_size in (0, 1, 2, 23, 24, 25, 100, 1000, 5000):
+        data = make_data(data_size)
+        for sort in (buffered_mergesort, bottom_up_mergesort):
+            test = data.copy()
+            result = sort(test)
+            assert result is test
+            assert result == sorted(data)
+
+
+def test_mergesort_stability():
+    seed(1)
+    data = [(randint(0, 5), i) for i in range(500)]
+    keys = [Key(pair) for pair in data]
+
+    for sort in (buffered_mergesort, bottom_up_mergesort):
+        result = sort(keys.copy())
+        assert [key.pair for key in result] == sorted(data, key=lambda pair: pair[0])
+
+
+class Key:
+    """Compares on the first item of pair only"""
+
+    def __init__(self, pair):
+        self.pair = pair
+
+    def __lt__(self, other):
+        return self.pair[0] < other.pair[0]
+
+
+def test_introsort():
+    seed(7)
+    inputs = [
+        make_data(5000),
+        list(range(3000)),
+        list(range(3000, 0, -1)),
+        [randint(0, 3) for _ in range(5000)],
+        [1] * 2000,
+        list(range(1000)) + list(range(1000, 0, -1)),
+        [],
+        [1],
+    ]
+    for data in inputs:
+        assert introsort(data.copy()) == sorted(data)
+
+
+def test_introsort_heapsort_fallback():
+    data = make_data(3000)
+    test = data.copy()
+    _introsort(test, 0, len(test) - 1, 0)
+    assert test == sorted(data)
+
+    test = data.copy()
+    _heapsort_range(test, 100, 2000)
+    assert test[100:2001] == sorted(data[100:2001])
+    assert test[:100] == data[:100] and test[2001:] == data[2001:]
+
+
+def test_radix_and_counting_sort():
+    seed(3)
+    inputs = [
+        make_data(5000),
+        [randint(-2 ** 40, 2 ** 40) for _ in range(3000)],
+        [randint(-5, 5) for _ in range(1000)],
+        [-1, -256, 255, 0, 256, -257],
+        [7],
+        [],
+    ]
+    for data in inputs:
+        test = data.copy()
+        assert radix_sort(test) is test
+        assert test == sorted(data)
+
+    for data in inputs[0:1] + inputs[2:]:
+        assert counting_sort(data.copy()) == sorted(data)
+
+    with pytest.raises(ValueError):
+        counting_sort([0, 2 ** 40])
+
+
+def test_integer_sorts_numpy():
+    numpy = pytest.importorskip("numpy")
+    data = numpy.array([5, -3, 300, -70000, 0, 5, 12], dtype=numpy.int32)
+
+    test = data.copy()
+    assert radix_sort(test) is test
+    assert test.tolist() == sorted(data.tolist())
+
+    test = data[data > -100].copy()
+    counting_sort(test)
+    assert test.tolist() == sorted(data[data > -100].tolist())
+
+    # The range of a narrow type can be wider than the type itself
+    for dtype in (numpy.int8, numpy.int16):
+        info = numpy.iinfo(dtype)
+        test = numpy.array([info.max, info.min, 0, info.max, -1], dtype=dtype)
+        assert counting_sort(test).tolist() == sorted(test.tolist())
+
+    # Floats would be truncated, so they are rejected like they are in a list
+    for sort in (radix_sort, counting_sort):
+        with pytest.raises(TypeError):
+            sort(numpy.array([0.5, 2.7, 1.2]))
+        with pytest.raises(TypeError):
+            sort([0.5, 2.7, 1.2])
+
+
+def test_natural_mergesort():
+    seed(11)
+    runs = []
+    for _ in range(50):
+        run = sorted(randint(0, 1000) for _ in range(randint(1, 300)))
+        runs += run if randint(0, 1) else run[::-1]
+    inputs = [
+        make_data(5000),
+        list(range(5000)),
+        list(range(5000, 0, -1)),
+        [randint(0, 3) for _ in range(5000)],
+        runs,
+        list(range(1000)) + list(range(1000)),
+        [],
+        [2, 1],
+    ]
+    for data in inputs:
+        test = data.copy()
+        assert natural_mergesort(test) is test
+        assert test == sorted(data)
+
+
+def test_natural_mergesort_stability():
+    seed(5)
+    data = [(randint(0, 20), i) for i in range(3000)]
+    data = sorted(data[:1500], reverse=True) + data[1500:]
+    keys = [Key(pair) for pair in data]
+
+    result = natural_mergesort(keys)
+    assert [key.pair for key in result] == sorted(data, key=lambda pair: pair[0])
+
+
+def test_binary_insertion_sort():
+    seed(9)
+    for data in (make_data(500), [randint(0, 5) for _ in range(300)], list(range(50, 0, -1)), [], [1]):
+        test = data.copy()
+        assert binary_insertion_sort(test) is test
+        assert test == sorted(data)
+
+    data = [(randint(0, 5), i) for i in range(300)]
+    keys = [Key(pair) for pair in data]
+    assert [key.pair for key in binary_insertion_sort(keys)] == sorted(data, key=lambda pair: pair[0])
+
+    data = [9, 1, 2, 3, 8, 0, 5, 4, 9]
+    _binary_insertion_sort(data, 1, 7, 4)
+    assert data == [9, 0, 1, 2, 3, 4, 5, 8, 9]
+
+
+def test_is_sorted():
+    assert is_sorted([]) and is_sorted([1]) and is_sorted([1, 1, 2])
+    assert not is_sorted([1, 3, 2])
+    # The old version compared every value to the first one only
+    assert not is_sorted([1, 5, 3])
+
+
+def test_analyze():
+    profile = analyze(list(range(1000)))
+    assert profile["runs"] == 1 and profile["inversions"] == 0
+    assert profile["integers"] and profile["key_range"] == 1000
+
+    profile = analyze(list(range(1000, 0, -1)))
+    assert profile["runs"] == 1000
+    assert profile["inversions"] == 1000 * 999 // 2
+
+    seed(2)
+    profile = analyze([randint(0, 9) for _ in range(5000)])
+    assert profile["duplicate_ratio"] > 0.9
+    assert (profile["minimum"], profile["maximum"]) == (0, 9)
+
+    assert analyze([])["runs"] == 0
+    assert not analyze([0.5, 1.5])["integers"]
+
+
+def test_sort_front_end():
+    seed(4)
+    cases = [
+        (list(range(3000)), "sorted"),
+        (list(range(3000, 0, -1)), "reversed"),
+        ([randint(0, 100) for _ in range(3000)], "counting_sort"),
+        (make_data(3000), "timsort"),
+        ([randint(0, 100) / 3 for _ in range(3000)], "timsort"),
+    ]
+    for data, strategy in cases:
+        assert _choose_strategy(analyze(data)) == strategy
+        test = data.copy()
+        assert sort(test) is test
+        assert test == sorted(data)
+
+    # A float the sample misses makes counting_sort() fail, so sort() falls back
+    data = [randint(0, 100) for _ in range(3000)]
+    data[1] = 0.5
+    assert sort(data.copy()) == sorted(data)
+
+    keys = [Key((randint(0, 5), i)) for i in range(500)]
+    assert [key.pair for key in sort(keys.copy())] == sorted((key.pair for key in keys), key=lambda pair: pair[0])
+
+
+def test_sort_front_end_numpy():
+    numpy = pytest.importorskip("numpy")
+    seed(6)
+    for data in (numpy.arange(500), numpy.arange(500, 0, -1),
+                 numpy.array([randint(0, 50) for _ in range(500)]),
+                 numpy.array(make_data(500), dtype=float)):
+        test = data.copy()
+        assert sort(test) is test
+        assert test.tolist() == sorted(data.tolist())
+
+    # Every comparison with a NaN is False, so NaNs must not hide disorder
+    nan = numpy.nan
+    for data in ([3.0, nan, 1.0, nan, 0.5], [3.0, nan, 1.0], [nan, 2.0, 1.0]):
+        test = numpy.array(data)
+        assert analyze(test)["nans"] == numpy.isnan(test).sum()
+        sort(test)
+        assert numpy.array_equal(test, numpy.sort(numpy.array(data)), equal_nan=True)
+
+    # Strings and objects have no NumPy min(), and int8 has a narrow range
+    for data in (numpy.array([str(x) for x in make_data(500)]),
+                 numpy.array([str(x) for x in range(500, 0, -1)]),
+                 numpy.array(make_data(500), dtype=object),
+                 numpy.array([randint(-128, 127) for _ in range(500)], dtype=numpy.int8)):
+        test = data.copy()
+        assert sort(test) is test
+        assert test.tolist() == sorted(data.tolist())
+
+
+def test_nth_element_and_quickselect():
+    seed(12)
+    inputs = [
+        make_data(3000),
+        list(range(3000)),
+        list(range(3000, 0, -1)),
+        [randint(0, 3) for _ in range(3000)],
+        [1] * 2000,
+        [4, 1, 3],
+    ]
+    for data in inputs:
+        expected = sorted(data)
+        for index in (0, len(data) // 2, len(data) - 1):
+            test = data.copy()
+            assert nth_element(test, index) is test
+            assert test[index] == expected[index]
+            assert max(test[:index + 1]) == test[index] == min(test[index:])
+            assert quickselect(data.copy(), index) == expected[index]
+
+    with pytest.raises(IndexError):
+        quickselect([1, 2], 2)
+
+
+def test_median_select_fallback():
+    data = make_data(3000)
+    for index in (0, 1234, 2999):
+        test = data.copy()
+        _median_select(test, 0, len(test) - 1, index)
+        assert test[index] == sorted(data)[index]
+
+
+def test_partial_sort_and_top_k():
+    data = make_data(3000)
+    test = data.copy()
+    assert partial_sort(test, 100) is test
+    assert test[:100] == sorted(data)[:100]
+    assert sorted(test) == sorted(data)
+    assert partial_sort(data.copy(), 5000) == sorted(data)
+    assert partial_sort([3, 1], 0) == [3, 1]
+
+    assert top_k(data, 10) == sorted(data, reverse=True)[:10]
+    assert top_k(iter(data), 10, largest=False) == sorted(data)[:10]
+    assert top_k(data, 0) == []
+
+
+def test_selection_numpy():
+    numpy = pytest.importorskip("numpy")
+    data = numpy.array(make_data(1000))
+    expected = sorted(data.tolist())
+
+    assert quickselect(data.copy(), 500) == expected[500]
+    assert partial_sort(data.copy(), 50)[:50].tolist() == expected[:50]
+    assert top_k(data, 5).tolist() == expected[:-6:-1]
+    assert top_k(data, 5, largest=False).tolist() == expected[:5]
+
+
+def test_sorted_iter():
+    data = make_data(3000)
+    original = data.copy()
+
+    assert list(islice(sorted_iter(data), 50)) == sorted(data)[:50]
+    assert list(sorted_iter(data)) == sorted(data)
+    assert list(sorted_iter(iter(data))) == sorted(data)
+    assert data == original
+    assert list(sorted_iter([])) == []
+
+
+class Record:
+    """A record whose key is expensive, so key calls are counted"""
+    calls = 0
+
+    def __init__(self, number, name):
+        self.number = number
+        self.name = name
+
+    def key(self):
+        Record.calls += 1
+        return self.number
+
+
+def test_argsort():
+    data = make_data(3000)
+    order = argsort(data)
+    assert order.typecode == "q"
+    assert [data[i] for i in order] == sorted(data)
+
+    seed(13)
+    records = [Record(randint(0, 50), i) for i in range(2000)]
+    Record.calls = 0
+    order = argsort(records, key=Record.key)
+    assert Record.calls == len(records)
+    # Equal keys keep their order
+    assert [records[i].name for i in order] == [record.name for record in sorted(records, key=Record.key)]
+    assert len(argsort([])) == 0
+
+
+def test_sort_with_key():
+    seed(14)
+    records = [Record(randint(0, 500), i) for i in range(3000)]
+    expected = [record.name for record in sorted(records, key=Record.key)]
+
+    test = records.copy()
+    Record.calls = 0
+    assert sort(test, key=Record.key) is test
+    assert Record.calls == len(records)
+    assert [record.name for record in test] == expected
+
+    # Already sorted by key: nothing moves
+    Record.calls = 0
+    assert [record.name for record in sort(test, key=Record.key)] == expected
+    assert Record.calls == len(records)
+
+    assert sort(["bb", "a", "ccc"], key=len) == ["a", "bb", "ccc"]
+
+
+def test_argsort_numpy():
+    numpy = pytest.importorskip("numpy")
+    data = numpy.array(make_data(1000))
+    assert data[argsort(data)].tolist() == sorted(data.tolist())
+
+    test = data.copy()
+    sort(test, key=lambda value: -value)
+    assert test.tolist() == sorted(data.tolist(), reverse=True)
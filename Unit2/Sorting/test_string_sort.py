@@ -0,0 +1,46 @@
+from random import seed, choice, randint
+import string_sort
+from string_sort import msd_radix_sort, make_strings, _shared_prefix_end
+
+
+def test_msd_radix_sort():
+    seed(8)
+    inputs = [
+        make_strings(20000),
+        make_strings(20000, prefix_length=0),
+        [choice(["a", "ab", "abc", "b", ""]) for _ in range(10000)],
+        ["same"] * 5000,
+        ["".join(choice("xy") for _ in range(randint(0, 30))) for _ in range(10000)],
+        ["é", "e", "z", "ß"],
+        [],
+        ["one"],
+    ]
+    for data in inputs:
+        test = data.copy()
+        assert msd_radix_sort(test) is test
+        assert test == sorted(data)
+
+
+def test_msd_radix_sort_stability():
+    # Strings that compare equal but are different objects keep their order
+    data = ["".join(["key", str(i % 3)]) for i in range(10000)]
+    ids = [id(value) for value in sorted(data)]
+    assert [id(value) for value in msd_radix_sort(data.copy())] == ids
+
+
+def test_shared_prefix_end():
+    assert _shared_prefix_end(["abcd", "abce", "abd"], 0) == 2
+    assert _shared_prefix_end(["ab", "abc"], 1) == 2
+    assert _shared_prefix_end(["x" * 100, "x" * 100 + "y"], 3) == 100
+    assert _shared_prefix_end(["pq", "rs"], 0) == 0
+
+
+def test_msd_radix_sort_small_buckets(monkeypatch):
+    # Deal all the way down, so the shared prefix and end-of-string
+    # paths run on every bucket
+    monkeypatch.setattr(string_sort, "BUCKET_THRESHOLD", 1)
+    seed(10)
+    for data in (make_strings(3000), ["same"] * 50 + ["sam", "samey"],
+                 [choice(["a", "ab", "abc", "b", ""]) for _ in range(500)]):
+        test = data.copy()
+        assert msd_radix_sort(test) == sorted(data)